@@ -0,0 +1,104 @@
+"""Generate the validators of the tables ahead of time.
+
+The validators of all tables in pyswap.components.tables are generated from
+their pandera schemas (see pyswap.core.validators) and written to the
+_generated_validators module, which is shipped with the package. The tables
+pick up their validators when the module is imported, so no code is generated
+at runtime.
+
+Run this module after changing a table:
+
+    python -m pyswap.components._gen_validators
+
+Functions:
+    generate_module: Generate the source of the _generated_validators module.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from pandera.dtypes import DataType
+
+from pyswap.components import tables
+from pyswap.core.basemodel import BaseTableModel
+from pyswap.core.validators import _is_compilable, generate_validator_source
+
+_TARGET = Path(__file__).with_name("_generated_validators.py")
+
+_HEADER = '''\
+# ruff: noqa: C901, TRY003
+# fmt: off
+"""Validators of the tables in pyswap.components.tables.
+
+Generated by pyswap.components._gen_validators; do not edit by hand.
+"""
+
+import numpy as np
+from pandera.engines.pandas_engine import Engine
+
+
+def _frame_check(table, k):
+    """Dataframe-wide check `k` of `table`, looked up when it is called."""
+
+    def check(df):
+        from pyswap.components import tables
+
+        return getattr(tables, table).to_schema().checks[k]._check_fn(df)
+
+    return check
+'''
+
+
+def _render(value, table: str, schema) -> str:
+    """Write a namespace value of a generated validator as source code."""
+    if isinstance(value, np.ndarray):
+        return f"np.array({value.tolist()!r}, dtype={str(value.dtype)!r})"
+    if isinstance(getattr(value, "__self__", None), DataType):
+        return f"Engine.dtype({str(value.__self__)!r}).coerce"
+    for k, check in enumerate(schema.checks):
+        if value is check._check_fn:
+            return f"_frame_check({table!r}, {k})"
+    if isinstance(value, float):
+        return f"float({str(value)!r})"
+    msg = f"Cannot write {value!r} of table {table} as source code."
+    raise TypeError(msg)
+
+
+def _tables() -> dict[str, type[BaseTableModel]]:
+    """Return the tables defined in pyswap.components.tables by name."""
+    return {
+        name: obj
+        for name, obj in vars(tables).items()
+        if isinstance(obj, type)
+        and issubclass(obj, BaseTableModel)
+        and obj is not BaseTableModel
+    }
+
+
+def generate_module() -> str:
+    """Generate the source of the _generated_validators module."""
+    parts = [_HEADER]
+    names = []
+    for table, cls in sorted(_tables().items()):
+        schema = cls.to_schema()
+        if not _is_compilable(schema):
+            continue
+        source, namespace = generate_validator_source(
+            schema, name=f"validate_{table}", prefix=f"_{table}"
+        )
+        constants = [
+            f"{key} = {_render(value, table, schema)}\n"
+            for key, value in namespace.items()
+            if key != "np"
+        ]
+        separator = "\n\n" if constants else ""
+        parts.append("".join(constants) + separator + source)
+        names.append(table)
+
+    mapping = "".join(f"    {table!r}: validate_{table},\n" for table in names)
+    parts.append(f"VALIDATORS = {{\n{mapping}}}\n")
+    return "\n\n".join(parts)
+
+
+if __name__ == "__main__":
+    _TARGET.write_text(generate_module())
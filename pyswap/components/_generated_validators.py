@@ -0,0 +1,2117 @@
+# ruff: noqa: C901, TRY003
+# fmt: off
+"""Validators of the tables in pyswap.components.tables.
+
+Generated by pyswap.components._gen_validators; do not edit by hand.
+"""
+
+import numpy as np
+from pandera.engines.pandas_engine import Engine
+
+
+def _frame_check(table, k):
+    """Dataframe-wide check `k` of `table`, looked up when it is called."""
+
+    def check(df):
+        from pyswap.components import tables
+
+        return getattr(tables, table).to_schema().checks[k]._check_fn(df)
+
+    return check
+
+
+def validate_AMAXTB(df):
+    columns = df.columns
+    if 'AMAX' not in columns:
+        raise ValueError('column ' + 'AMAX' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'AMAX': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['AMAX']].isna().to_numpy().any():
+        raise ValueError('AMAX contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['AMAX']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'AMAX' + ' out of bounds')
+    if (a > 100.0).any():
+        raise ValueError('column ' + 'AMAX' + ' out of bounds')
+    return df
+
+
+def validate_CFTB(df):
+    columns = df.columns
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'CF': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    if 'CF' in columns:
+        s = df['CF']
+        if s.isna().any():
+            raise ValueError('column ' + 'CF' + ' contains nulls')
+    return df
+
+
+def validate_CHTB(df):
+    columns = df.columns
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'CF': 'float64', 'CH': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    if 'CF' in columns:
+        s = df['CF']
+        if s.isna().any():
+            raise ValueError('column ' + 'CF' + ' contains nulls')
+    if 'CH' in columns:
+        s = df['CH']
+        if s.isna().any():
+            raise ValueError('column ' + 'CH' + ' contains nulls')
+    return df
+
+
+def validate_CO2AMAXTB(df):
+    columns = df.columns
+    if 'CO2PPM' not in columns:
+        raise ValueError('column ' + 'CO2PPM' + ' is missing')
+    if 'FACTOR' not in columns:
+        raise ValueError('column ' + 'FACTOR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'CO2PPM': 'float64', 'FACTOR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['CO2PPM', 'FACTOR']].isna().to_numpy().any():
+        raise ValueError('CO2PPM, FACTOR contain nulls')
+    return df
+
+
+def validate_CO2EFFTB(df):
+    columns = df.columns
+    if 'CO2PPM' not in columns:
+        raise ValueError('column ' + 'CO2PPM' + ' is missing')
+    if 'FACTOR' not in columns:
+        raise ValueError('column ' + 'FACTOR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'CO2PPM': 'float64', 'FACTOR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['CO2PPM', 'FACTOR']].isna().to_numpy().any():
+        raise ValueError('CO2PPM, FACTOR contain nulls')
+    return df
+
+
+def validate_CO2TRATB(df):
+    columns = df.columns
+    if 'CO2PPM' not in columns:
+        raise ValueError('column ' + 'CO2PPM' + ' is missing')
+    if 'FACTOR' not in columns:
+        raise ValueError('column ' + 'FACTOR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'CO2PPM': 'float64', 'FACTOR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['CO2PPM', 'FACTOR']].isna().to_numpy().any():
+        raise ValueError('CO2PPM, FACTOR contain nulls')
+    return df
+
+
+_CROPROTATION_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+_CROPROTATION_coerce_1 = Engine.dtype('datetime64[ns]').coerce
+_CROPROTATION_coerce_2 = Engine.dtype('str').coerce
+_CROPROTATION_allowed_3 = np.array([1, 2, 3], dtype='int64')
+
+
+def validate_CROPROTATION(df):
+    columns = df.columns
+    if 'CROPSTART' not in columns:
+        raise ValueError('column ' + 'CROPSTART' + ' is missing')
+    if 'CROPEND' not in columns:
+        raise ValueError('column ' + 'CROPEND' + ' is missing')
+    if 'CROPFIL' not in columns:
+        raise ValueError('column ' + 'CROPFIL' + ' is missing')
+    if 'CROPTYPE' not in columns:
+        raise ValueError('column ' + 'CROPTYPE' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'CROPTYPE': 'int64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    s = df['CROPSTART']
+    s = _CROPROTATION_coerce_0(s)
+    df['CROPSTART'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'CROPSTART' + ' contains nulls')
+    s = df['CROPEND']
+    s = _CROPROTATION_coerce_1(s)
+    df['CROPEND'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'CROPEND' + ' contains nulls')
+    s = df['CROPFIL']
+    s = _CROPROTATION_coerce_2(s)
+    df['CROPFIL'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'CROPFIL' + ' contains nulls')
+    s = df['CROPTYPE']
+    if not np.isin(s.to_numpy(), _CROPROTATION_allowed_3).all():
+        raise ValueError('column ' + 'CROPTYPE' + ' out of bounds')
+    return df
+
+
+_CSEEPARR_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_CSEEPARR(df):
+    columns = df.columns
+    if 'DATEC' not in columns:
+        raise ValueError('column ' + 'DATEC' + ' is missing')
+    if 'CSEEPARR' not in columns:
+        raise ValueError('column ' + 'CSEEPARR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'CSEEPARR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['CSEEPARR']].isna().to_numpy().any():
+        raise ValueError('CSEEPARR contain nulls')
+    s = df['DATEC']
+    s = _CSEEPARR_coerce_0(s)
+    df['DATEC'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATEC' + ' contains nulls')
+    return df
+
+
+_DAILYMETEODATA_coerce_0 = Engine.dtype('str').coerce
+_DAILYMETEODATA_lower_0 = np.array([1, 1, 1800], dtype='int64')
+_DAILYMETEODATA_upper_0 = np.array([31, 12, 2200], dtype='int64')
+_DAILYMETEODATA_frame_check_0 = _frame_check('DAILYMETEODATA', 0)
+
+
+def validate_DAILYMETEODATA(df):
+    columns = df.columns
+    if 'STATION' not in columns:
+        raise ValueError('column ' + 'STATION' + ' is missing')
+    if 'DD' not in columns:
+        raise ValueError('column ' + 'DD' + ' is missing')
+    if 'MM' not in columns:
+        raise ValueError('column ' + 'MM' + ' is missing')
+    if 'YYYY' not in columns:
+        raise ValueError('column ' + 'YYYY' + ' is missing')
+    if 'RAD' not in columns:
+        raise ValueError('column ' + 'RAD' + ' is missing')
+    if 'TMIN' not in columns:
+        raise ValueError('column ' + 'TMIN' + ' is missing')
+    if 'TMAX' not in columns:
+        raise ValueError('column ' + 'TMAX' + ' is missing')
+    if 'HUM' not in columns:
+        raise ValueError('column ' + 'HUM' + ' is missing')
+    if 'WIND' not in columns:
+        raise ValueError('column ' + 'WIND' + ' is missing')
+    if 'RAIN' not in columns:
+        raise ValueError('column ' + 'RAIN' + ' is missing')
+    if 'ETREF' not in columns:
+        raise ValueError('column ' + 'ETREF' + ' is missing')
+    if 'WET' not in columns:
+        raise ValueError('column ' + 'WET' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DD': 'int64', 'MM': 'int64', 'YYYY': 'int64', 'RAD': 'float64', 'TMIN': 'float64', 'TMAX': 'float64', 'HUM': 'float64', 'WIND': 'float64', 'RAIN': 'float64', 'ETREF': 'float64', 'WET': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RAD', 'TMIN', 'TMAX', 'HUM', 'WIND', 'RAIN', 'ETREF', 'WET']].isna().to_numpy().any():
+        raise ValueError('RAD, TMIN, TMAX, HUM, WIND, RAIN, ETREF, WET contain nulls')
+    s = df['STATION']
+    s = _DAILYMETEODATA_coerce_0(s)
+    df['STATION'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'STATION' + ' contains nulls')
+    s = df['RAIN']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'RAIN' + ' out of bounds')
+    a = df[['DD', 'MM', 'YYYY']].to_numpy()
+    if ((a < _DAILYMETEODATA_lower_0) | (a > _DAILYMETEODATA_upper_0)).any():
+        raise ValueError('DD, MM, YYYY out of bounds')
+    if not np.all(_DAILYMETEODATA_frame_check_0(df)):
+        raise ValueError('check ' + 'tmin_not_above_tmax' + ' failed')
+    return df
+
+
+_DATEHARVEST_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATEHARVEST(df):
+    columns = df.columns
+    if 'DATEHARVEST' not in columns:
+        raise ValueError('column ' + 'DATEHARVEST' + ' is missing')
+    s = df['DATEHARVEST']
+    s = _DATEHARVEST_coerce_0(s)
+    df['DATEHARVEST'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATEHARVEST' + ' contains nulls')
+    return df
+
+
+_DATET_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATET(df):
+    columns = df.columns
+    if 'DATET' not in columns:
+        raise ValueError('column ' + 'DATET' + ' is missing')
+    if 'TBOT' not in columns:
+        raise ValueError('column ' + 'TBOT' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'TBOT': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['TBOT']].isna().to_numpy().any():
+        raise ValueError('TBOT contain nulls')
+    s = df['DATET']
+    s = _DATET_coerce_0(s)
+    df['DATET'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATET' + ' contains nulls')
+    return df
+
+
+_DATOWLTB1_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATOWLTB1(df):
+    columns = df.columns
+    if 'DATOWL1' not in columns:
+        raise ValueError('column ' + 'DATOWL1' + ' is missing')
+    if 'LEVEL1' not in columns:
+        raise ValueError('column ' + 'LEVEL1' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEVEL1': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LEVEL1']].isna().to_numpy().any():
+        raise ValueError('LEVEL1 contain nulls')
+    s = df['DATOWL1']
+    s = _DATOWLTB1_coerce_0(s)
+    df['DATOWL1'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATOWL1' + ' contains nulls')
+    return df
+
+
+_DATOWLTB2_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATOWLTB2(df):
+    columns = df.columns
+    if 'DATOWL2' not in columns:
+        raise ValueError('column ' + 'DATOWL2' + ' is missing')
+    if 'LEVEL2' not in columns:
+        raise ValueError('column ' + 'LEVEL2' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEVEL2': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LEVEL2']].isna().to_numpy().any():
+        raise ValueError('LEVEL2 contain nulls')
+    s = df['DATOWL2']
+    s = _DATOWLTB2_coerce_0(s)
+    df['DATOWL2'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATOWL2' + ' contains nulls')
+    return df
+
+
+_DATOWLTB3_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATOWLTB3(df):
+    columns = df.columns
+    if 'DATOWL3' not in columns:
+        raise ValueError('column ' + 'DATOWL3' + ' is missing')
+    if 'LEVEL3' not in columns:
+        raise ValueError('column ' + 'LEVEL3' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEVEL3': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LEVEL3']].isna().to_numpy().any():
+        raise ValueError('LEVEL3 contain nulls')
+    s = df['DATOWL3']
+    s = _DATOWLTB3_coerce_0(s)
+    df['DATOWL3'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATOWL3' + ' contains nulls')
+    return df
+
+
+_DATOWLTB4_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATOWLTB4(df):
+    columns = df.columns
+    if 'DATOWL4' not in columns:
+        raise ValueError('column ' + 'DATOWL4' + ' is missing')
+    if 'LEVEL4' not in columns:
+        raise ValueError('column ' + 'LEVEL4' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEVEL4': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LEVEL4']].isna().to_numpy().any():
+        raise ValueError('LEVEL4 contain nulls')
+    s = df['DATOWL4']
+    s = _DATOWLTB4_coerce_0(s)
+    df['DATOWL4'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATOWL4' + ' contains nulls')
+    return df
+
+
+_DATOWLTB5_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_DATOWLTB5(df):
+    columns = df.columns
+    if 'DATOWL5' not in columns:
+        raise ValueError('column ' + 'DATOWL5' + ' is missing')
+    if 'LEVEL5' not in columns:
+        raise ValueError('column ' + 'LEVEL5' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEVEL5': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LEVEL5']].isna().to_numpy().any():
+        raise ValueError('LEVEL5 contain nulls')
+    s = df['DATOWL5']
+    s = _DATOWLTB5_coerce_0(s)
+    df['DATOWL5'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATOWL5' + ' contains nulls')
+    return df
+
+
+def validate_DC1TB(df):
+    columns = df.columns
+    if 'DVS_DC1' not in columns:
+        raise ValueError('column ' + 'DVS_DC1' + ' is missing')
+    if 'DI' not in columns:
+        raise ValueError('column ' + 'DI' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_DC1': 'float64', 'DI': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_DC1', 'DI']].isna().to_numpy().any():
+        raise ValueError('DVS_DC1, DI contain nulls')
+    return df
+
+
+def validate_DC2TB(df):
+    columns = df.columns
+    if 'DVS_DC2' not in columns:
+        raise ValueError('column ' + 'DVS_DC2' + ' is missing')
+    if 'FID' not in columns:
+        raise ValueError('column ' + 'FID' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_DC2': 'float64', 'FID': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_DC2', 'FID']].isna().to_numpy().any():
+        raise ValueError('DVS_DC2, FID contain nulls')
+    return df
+
+
+_DETAILEDRAINFALL_coerce_0 = Engine.dtype('str').coerce
+
+
+def validate_DETAILEDRAINFALL(df):
+    columns = df.columns
+    if 'Station' not in columns:
+        raise ValueError('column ' + 'Station' + ' is missing')
+    if 'Day' not in columns:
+        raise ValueError('column ' + 'Day' + ' is missing')
+    if 'Month' not in columns:
+        raise ValueError('column ' + 'Month' + ' is missing')
+    if 'Year' not in columns:
+        raise ValueError('column ' + 'Year' + ' is missing')
+    if 'Time' not in columns:
+        raise ValueError('column ' + 'Time' + ' is missing')
+    if 'Amount' not in columns:
+        raise ValueError('column ' + 'Amount' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'Day': 'int64', 'Month': 'int64', 'Year': 'int64', 'Time': 'float64', 'Amount': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['Time', 'Amount']].isna().to_numpy().any():
+        raise ValueError('Time, Amount contain nulls')
+    s = df['Station']
+    s = _DETAILEDRAINFALL_coerce_0(s)
+    df['Station'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'Station' + ' contains nulls')
+    return df
+
+
+_DMGRZTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_DMGRZTB_upper_0 = np.array([366.0, 1000000.0], dtype='float64')
+
+
+def validate_DMGRZTB(df):
+    columns = df.columns
+    if 'DNR' not in columns:
+        raise ValueError('column ' + 'DNR' + ' is missing')
+    if 'DMGRZ' not in columns:
+        raise ValueError('column ' + 'DMGRZ' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DNR': 'float64', 'DMGRZ': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DNR', 'DMGRZ']].isna().to_numpy().any():
+        raise ValueError('DNR, DMGRZ contain nulls')
+    a = df[['DNR', 'DMGRZ']].to_numpy()
+    if ((a < _DMGRZTB_lower_0) | (a > _DMGRZTB_upper_0)).any():
+        raise ValueError('DNR, DMGRZ out of bounds')
+    return df
+
+
+def validate_DMMOWDELAY(df):
+    columns = df.columns
+    if 'DMMOWDELAY' not in columns:
+        raise ValueError('column ' + 'DMMOWDELAY' + ' is missing')
+    if 'DAYDELAY' not in columns:
+        raise ValueError('column ' + 'DAYDELAY' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DMMOWDELAY': 'float64', 'DAYDELAY': 'int64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DMMOWDELAY']].isna().to_numpy().any():
+        raise ValueError('DMMOWDELAY contain nulls')
+    s = df['DMMOWDELAY']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'DMMOWDELAY' + ' out of bounds')
+    if (a > 1000000.0).any():
+        raise ValueError('column ' + 'DMMOWDELAY' + ' out of bounds')
+    s = df['DAYDELAY']
+    a = s.to_numpy()
+    if (a < 0).any():
+        raise ValueError('column ' + 'DAYDELAY' + ' out of bounds')
+    if (a > 366).any():
+        raise ValueError('column ' + 'DAYDELAY' + ' out of bounds')
+    return df
+
+
+_DMMOWTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_DMMOWTB_upper_0 = np.array([366.0, 1000000.0], dtype='float64')
+
+
+def validate_DMMOWTB(df):
+    columns = df.columns
+    if 'DNR' not in columns:
+        raise ValueError('column ' + 'DNR' + ' is missing')
+    if 'DMMOW' not in columns:
+        raise ValueError('column ' + 'DMMOW' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DNR': 'float64', 'DMMOW': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DNR', 'DMMOW']].isna().to_numpy().any():
+        raise ValueError('DNR, DMMOW contain nulls')
+    a = df[['DNR', 'DMMOW']].to_numpy()
+    if ((a < _DMMOWTB_lower_0) | (a > _DMMOWTB_upper_0)).any():
+        raise ValueError('DNR, DMMOW out of bounds')
+    return df
+
+
+_DRAINAGELEVELTOPPARAMS_lower_0 = np.array([-10000.0, 0.0], dtype='float64')
+_DRAINAGELEVELTOPPARAMS_upper_0 = np.array([0.0, 1.0], dtype='float64')
+
+
+def validate_DRAINAGELEVELTOPPARAMS(df):
+    columns = df.columns
+    if 'SWTOPDISLAY' not in columns:
+        raise ValueError('column ' + 'SWTOPDISLAY' + ' is missing')
+    if 'ZTOPDISLAY' not in columns:
+        raise ValueError('column ' + 'ZTOPDISLAY' + ' is missing')
+    if 'FTOPDISLAY' not in columns:
+        raise ValueError('column ' + 'FTOPDISLAY' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ZTOPDISLAY': 'float64', 'FTOPDISLAY': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['ZTOPDISLAY', 'FTOPDISLAY']].isna().to_numpy().any():
+        raise ValueError('ZTOPDISLAY, FTOPDISLAY contain nulls')
+    s = df['SWTOPDISLAY']
+    if s.isna().any():
+        raise ValueError('column ' + 'SWTOPDISLAY' + ' contains nulls')
+    a = df[['ZTOPDISLAY', 'FTOPDISLAY']].to_numpy()
+    if ((a < _DRAINAGELEVELTOPPARAMS_lower_0) | (a > _DRAINAGELEVELTOPPARAMS_upper_0)).any():
+        raise ValueError('ZTOPDISLAY, FTOPDISLAY out of bounds')
+    return df
+
+
+_DRNTB_allowed_0 = np.array([1, 2, 3, 4, 5], dtype='int64')
+_DRNTB_lower_0 = np.array([1.0, -1000.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.01], dtype='float64')
+_DRNTB_upper_0 = np.array([100000.0, 0.0, 100000.0, 100000.0, 100.0, 100.0, 10000.0, 5.0], dtype='float64')
+
+
+def validate_DRNTB(df):
+    columns = df.columns
+    if 'LEV' not in columns:
+        raise ValueError('column ' + 'LEV' + ' is missing')
+    if 'SWDTYP' not in columns:
+        raise ValueError('column ' + 'SWDTYP' + ' is missing')
+    if 'L' not in columns:
+        raise ValueError('column ' + 'L' + ' is missing')
+    if 'ZBOTDRE' not in columns:
+        raise ValueError('column ' + 'ZBOTDRE' + ' is missing')
+    if 'GWLINF' not in columns:
+        raise ValueError('column ' + 'GWLINF' + ' is missing')
+    if 'RDRAIN' not in columns:
+        raise ValueError('column ' + 'RDRAIN' + ' is missing')
+    if 'RINFI' not in columns:
+        raise ValueError('column ' + 'RINFI' + ' is missing')
+    if 'RENTRY' not in columns:
+        raise ValueError('column ' + 'RENTRY' + ' is missing')
+    if 'REXIT' not in columns:
+        raise ValueError('column ' + 'REXIT' + ' is missing')
+    if 'WIDTHR' not in columns:
+        raise ValueError('column ' + 'WIDTHR' + ' is missing')
+    if 'TALUDR' not in columns:
+        raise ValueError('column ' + 'TALUDR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LEV': 'int64', 'L': 'float64', 'ZBOTDRE': 'float64', 'GWLINF': 'float64', 'RDRAIN': 'float64', 'RINFI': 'float64', 'RENTRY': 'float64', 'REXIT': 'float64', 'WIDTHR': 'float64', 'TALUDR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['L', 'ZBOTDRE', 'GWLINF', 'RDRAIN', 'RINFI', 'RENTRY', 'REXIT', 'WIDTHR', 'TALUDR']].isna().to_numpy().any():
+        raise ValueError('L, ZBOTDRE, GWLINF, RDRAIN, RINFI, RENTRY, REXIT, WIDTHR, TALUDR contain nulls')
+    s = df['LEV']
+    if not np.isin(s.to_numpy(), _DRNTB_allowed_0).all():
+        raise ValueError('column ' + 'LEV' + ' out of bounds')
+    s = df['SWDTYP']
+    if s.isna().any():
+        raise ValueError('column ' + 'SWDTYP' + ' contains nulls')
+    a = df[['L', 'GWLINF', 'RDRAIN', 'RINFI', 'RENTRY', 'REXIT', 'WIDTHR', 'TALUDR']].to_numpy()
+    if ((a < _DRNTB_lower_0) | (a > _DRNTB_upper_0)).any():
+        raise ValueError('L, GWLINF, RDRAIN, RINFI, RENTRY, REXIT, WIDTHR, TALUDR out of bounds')
+    return df
+
+
+_DTSMTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_DTSMTB_upper_0 = np.array([100.0, 60.0], dtype='float64')
+
+
+def validate_DTSMTB(df):
+    columns = df.columns
+    if 'TAV' not in columns:
+        raise ValueError('column ' + 'TAV' + ' is missing')
+    if 'DTSM' not in columns:
+        raise ValueError('column ' + 'DTSM' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'TAV': 'float64', 'DTSM': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['TAV', 'DTSM']].isna().to_numpy().any():
+        raise ValueError('TAV, DTSM contain nulls')
+    a = df[['TAV', 'DTSM']].to_numpy()
+    if ((a < _DTSMTB_lower_0) | (a > _DTSMTB_upper_0)).any():
+        raise ValueError('TAV, DTSM out of bounds')
+    return df
+
+
+def validate_FLTB(df):
+    columns = df.columns
+    if 'FL' not in columns:
+        raise ValueError('column ' + 'FL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'FL': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['FL']].isna().to_numpy().any():
+        raise ValueError('FL contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['FL']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'FL' + ' out of bounds')
+    if (a > 1.0).any():
+        raise ValueError('column ' + 'FL' + ' out of bounds')
+    return df
+
+
+_FOTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_FOTB_upper_0 = np.array([2.0, 1.0], dtype='float64')
+
+
+def validate_FOTB(df):
+    columns = df.columns
+    if 'DVS' not in columns:
+        raise ValueError('column ' + 'DVS' + ' is missing')
+    if 'FO' not in columns:
+        raise ValueError('column ' + 'FO' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'FO': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS', 'FO']].isna().to_numpy().any():
+        raise ValueError('DVS, FO contain nulls')
+    a = df[['DVS', 'FO']].to_numpy()
+    if ((a < _FOTB_lower_0) | (a > _FOTB_upper_0)).any():
+        raise ValueError('DVS, FO out of bounds')
+    return df
+
+
+def validate_FRTB(df):
+    columns = df.columns
+    if 'FR' not in columns:
+        raise ValueError('column ' + 'FR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'FR': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['FR']].isna().to_numpy().any():
+        raise ValueError('FR contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['FR']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'FR' + ' out of bounds')
+    if (a > 1.0).any():
+        raise ValueError('column ' + 'FR' + ' out of bounds')
+    return df
+
+
+def validate_FSTB(df):
+    columns = df.columns
+    if 'FS' not in columns:
+        raise ValueError('column ' + 'FS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'FS': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['FS']].isna().to_numpy().any():
+        raise ValueError('FS contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['FS']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'FS' + ' out of bounds')
+    if (a > 1.0).any():
+        raise ValueError('column ' + 'FS' + ' out of bounds')
+    return df
+
+
+_GCTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_GCTB_upper_0 = np.array([2.0, 12.0], dtype='float64')
+
+
+def validate_GCTB(df):
+    columns = df.columns
+    if 'DVS' not in columns:
+        raise ValueError('column ' + 'DVS' + ' is missing')
+    if 'LAI' not in columns:
+        raise ValueError('column ' + 'LAI' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'LAI': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS', 'LAI']].isna().to_numpy().any():
+        raise ValueError('DVS, LAI contain nulls')
+    a = df[['DVS', 'LAI']].to_numpy()
+    if ((a < _GCTB_lower_0) | (a > _GCTB_upper_0)).any():
+        raise ValueError('DVS, LAI out of bounds')
+    return df
+
+
+_GWLEVEL_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_GWLEVEL(df):
+    columns = df.columns
+    if 'DATE1' not in columns:
+        raise ValueError('column ' + 'DATE1' + ' is missing')
+    if 'GWLEVEL' not in columns:
+        raise ValueError('column ' + 'GWLEVEL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'GWLEVEL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['GWLEVEL']].isna().to_numpy().any():
+        raise ValueError('GWLEVEL contain nulls')
+    s = df['DATE1']
+    s = _GWLEVEL_coerce_0(s)
+    df['DATE1'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE1' + ' contains nulls')
+    return df
+
+
+_HAQUIF_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_HAQUIF(df):
+    columns = df.columns
+    if 'DATE3' not in columns:
+        raise ValueError('column ' + 'DATE3' + ' is missing')
+    if 'HAQUIF' not in columns:
+        raise ValueError('column ' + 'HAQUIF' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'HAQUIF': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['HAQUIF']].isna().to_numpy().any():
+        raise ValueError('HAQUIF contain nulls')
+    s = df['DATE3']
+    s = _HAQUIF_coerce_0(s)
+    df['DATE3'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE3' + ' contains nulls')
+    return df
+
+
+_HBOT5_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_HBOT5(df):
+    columns = df.columns
+    if 'DATE5' not in columns:
+        raise ValueError('column ' + 'DATE5' + ' is missing')
+    if 'HBOT5' not in columns:
+        raise ValueError('column ' + 'HBOT5' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'HBOT5': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['HBOT5']].isna().to_numpy().any():
+        raise ValueError('HBOT5 contain nulls')
+    s = df['DATE5']
+    s = _HBOT5_coerce_0(s)
+    df['DATE5'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE5' + ' contains nulls')
+    return df
+
+
+_INIPRESSUREHEAD_lower_0 = np.array([-100000.0, -10000000000.0], dtype='float64')
+_INIPRESSUREHEAD_upper_0 = np.array([0.0, 10000.0], dtype='float64')
+
+
+def validate_INIPRESSUREHEAD(df):
+    columns = df.columns
+    if 'ZI' not in columns:
+        raise ValueError('column ' + 'ZI' + ' is missing')
+    if 'H' not in columns:
+        raise ValueError('column ' + 'H' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ZI': 'float64', 'H': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['ZI', 'H']].isna().to_numpy().any():
+        raise ValueError('ZI, H contain nulls')
+    a = df[['ZI', 'H']].to_numpy()
+    if ((a < _INIPRESSUREHEAD_lower_0) | (a > _INIPRESSUREHEAD_upper_0)).any():
+        raise ValueError('ZI, H out of bounds')
+    return df
+
+
+def validate_INISSOIL(df):
+    columns = df.columns
+    if 'ZC' not in columns:
+        raise ValueError('column ' + 'ZC' + ' is missing')
+    if 'CML' not in columns:
+        raise ValueError('column ' + 'CML' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ZC': 'float64', 'CML': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['ZC', 'CML']].isna().to_numpy().any():
+        raise ValueError('ZC, CML contain nulls')
+    return df
+
+
+_INITSOILTEMP_lower_0 = np.array([-100000.0, -50.0], dtype='float64')
+_INITSOILTEMP_upper_0 = np.array([0.0, 50.0], dtype='float64')
+
+
+def validate_INITSOILTEMP(df):
+    columns = df.columns
+    if 'ZH' not in columns:
+        raise ValueError('column ' + 'ZH' + ' is missing')
+    if 'TSOIL' not in columns:
+        raise ValueError('column ' + 'TSOIL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ZH': 'float64', 'TSOIL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['ZH', 'TSOIL']].isna().to_numpy().any():
+        raise ValueError('ZH, TSOIL contain nulls')
+    a = df[['ZH', 'TSOIL']].to_numpy()
+    if ((a < _INITSOILTEMP_lower_0) | (a > _INITSOILTEMP_upper_0)).any():
+        raise ValueError('ZH, TSOIL out of bounds')
+    return df
+
+
+_INTERTB_lower_0 = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0], dtype='float64')
+_INTERTB_upper_0 = np.array([366.0, 1.0, 1.0, 10.0, 100.0, 10.0], dtype='float64')
+
+
+def validate_INTERTB(df):
+    columns = df.columns
+    if 'T' not in columns:
+        raise ValueError('column ' + 'T' + ' is missing')
+    if 'PFREE' not in columns:
+        raise ValueError('column ' + 'PFREE' + ' is missing')
+    if 'PSTEM' not in columns:
+        raise ValueError('column ' + 'PSTEM' + ' is missing')
+    if 'SCANOPY' not in columns:
+        raise ValueError('column ' + 'SCANOPY' + ' is missing')
+    if 'AVPREC' not in columns:
+        raise ValueError('column ' + 'AVPREC' + ' is missing')
+    if 'AVEVAP' not in columns:
+        raise ValueError('column ' + 'AVEVAP' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'T': 'float64', 'PFREE': 'float64', 'PSTEM': 'float64', 'SCANOPY': 'float64', 'AVPREC': 'float64', 'AVEVAP': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['T', 'PFREE', 'PSTEM', 'SCANOPY', 'AVPREC', 'AVEVAP']].isna().to_numpy().any():
+        raise ValueError('T, PFREE, PSTEM, SCANOPY, AVPREC, AVEVAP contain nulls')
+    a = df[['T', 'PFREE', 'PSTEM', 'SCANOPY', 'AVPREC', 'AVEVAP']].to_numpy()
+    if ((a < _INTERTB_lower_0) | (a > _INTERTB_upper_0)).any():
+        raise ValueError('T, PFREE, PSTEM, SCANOPY, AVPREC, AVEVAP out of bounds')
+    return df
+
+
+_IRRIGEVENTS_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+_IRRIGEVENTS_allowed_3 = np.array([0, 1], dtype='int64')
+
+
+def validate_IRRIGEVENTS(df):
+    columns = df.columns
+    if 'IRDATE' not in columns:
+        raise ValueError('column ' + 'IRDATE' + ' is missing')
+    if 'IRCONC' not in columns:
+        raise ValueError('column ' + 'IRCONC' + ' is missing')
+    if 'IRTYPE' not in columns:
+        raise ValueError('column ' + 'IRTYPE' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'IRDEPTH': 'float64', 'IRCONC': 'float64', 'IRTYPE': 'int64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['IRCONC']].isna().to_numpy().any():
+        raise ValueError('IRCONC contain nulls')
+    s = df['IRDATE']
+    s = _IRRIGEVENTS_coerce_0(s)
+    df['IRDATE'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'IRDATE' + ' contains nulls')
+    if 'IRDEPTH' in columns:
+        s = df['IRDEPTH']
+        if s.isna().any():
+            raise ValueError('column ' + 'IRDEPTH' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'IRDEPTH' + ' out of bounds')
+        if (a > 1000.0).any():
+            raise ValueError('column ' + 'IRDEPTH' + ' out of bounds')
+    s = df['IRCONC']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'IRCONC' + ' out of bounds')
+    if (a > 1000.0).any():
+        raise ValueError('column ' + 'IRCONC' + ' out of bounds')
+    s = df['IRTYPE']
+    if not np.isin(s.to_numpy(), _IRRIGEVENTS_allowed_3).all():
+        raise ValueError('column ' + 'IRTYPE' + ' out of bounds')
+    return df
+
+
+_KYTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_KYTB_upper_0 = np.array([2.0, 5.0], dtype='float64')
+
+
+def validate_KYTB(df):
+    columns = df.columns
+    if 'DVS' not in columns:
+        raise ValueError('column ' + 'DVS' + ' is missing')
+    if 'KY' not in columns:
+        raise ValueError('column ' + 'KY' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'KY': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS', 'KY']].isna().to_numpy().any():
+        raise ValueError('DVS, KY contain nulls')
+    a = df[['DVS', 'KY']].to_numpy()
+    if ((a < _KYTB_lower_0) | (a > _KYTB_upper_0)).any():
+        raise ValueError('DVS, KY out of bounds')
+    return df
+
+
+def validate_LSDATB(df):
+    columns = df.columns
+    if 'SEQNR' not in columns:
+        raise ValueError('column ' + 'SEQNR' + ' is missing')
+    if 'LSDA' not in columns:
+        raise ValueError('column ' + 'LSDA' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'SEQNR': 'int64', 'LSDA': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LSDA']].isna().to_numpy().any():
+        raise ValueError('LSDA contain nulls')
+    s = df['SEQNR']
+    a = s.to_numpy()
+    if (a < 0).any():
+        raise ValueError('column ' + 'SEQNR' + ' out of bounds')
+    if (a > 366).any():
+        raise ValueError('column ' + 'SEQNR' + ' out of bounds')
+    s = df['LSDA']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'LSDA' + ' out of bounds')
+    if (a > 1000.0).any():
+        raise ValueError('column ' + 'LSDA' + ' out of bounds')
+    return df
+
+
+_LSDBTB_lower_0 = np.array([0.0, 0.0, 0.0, 0.0], dtype='float64')
+_LSDBTB_upper_0 = np.array([1000.0, 366.0, 1000.0, 1000.0], dtype='float64')
+
+
+def validate_LSDBTB(df):
+    columns = df.columns
+    if 'LSDb' not in columns:
+        raise ValueError('column ' + 'LSDb' + ' is missing')
+    if 'DAYSGRAZING' not in columns:
+        raise ValueError('column ' + 'DAYSGRAZING' + ' is missing')
+    if 'UPTGRAZING' not in columns:
+        raise ValueError('column ' + 'UPTGRAZING' + ' is missing')
+    if 'LOSSGRAZING' not in columns:
+        raise ValueError('column ' + 'LOSSGRAZING' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LSDb': 'float64', 'DAYSGRAZING': 'float64', 'UPTGRAZING': 'float64', 'LOSSGRAZING': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LSDb', 'DAYSGRAZING', 'UPTGRAZING', 'LOSSGRAZING']].isna().to_numpy().any():
+        raise ValueError('LSDb, DAYSGRAZING, UPTGRAZING, LOSSGRAZING contain nulls')
+    a = df[['LSDb', 'DAYSGRAZING', 'UPTGRAZING', 'LOSSGRAZING']].to_numpy()
+    if ((a < _LSDBTB_lower_0) | (a > _LSDBTB_upper_0)).any():
+        raise ValueError('LSDb, DAYSGRAZING, UPTGRAZING, LOSSGRAZING out of bounds')
+    return df
+
+
+_MANSECWATLVL_coerce_1 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_MANSECWATLVL(df):
+    columns = df.columns
+    if 'IMPER_4B' not in columns:
+        raise ValueError('column ' + 'IMPER_4B' + ' is missing')
+    if 'IMPEND' not in columns:
+        raise ValueError('column ' + 'IMPEND' + ' is missing')
+    if 'SWMAN' not in columns:
+        raise ValueError('column ' + 'SWMAN' + ' is missing')
+    if 'WSCAP' not in columns:
+        raise ValueError('column ' + 'WSCAP' + ' is missing')
+    if 'WLDIP' not in columns:
+        raise ValueError('column ' + 'WLDIP' + ' is missing')
+    if 'INTWL' not in columns:
+        raise ValueError('column ' + 'INTWL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'IMPER_4B': 'float64', 'SWMAN': 'float64', 'WSCAP': 'float64', 'WLDIP': 'float64', 'INTWL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['IMPER_4B', 'SWMAN', 'WSCAP', 'WLDIP', 'INTWL']].isna().to_numpy().any():
+        raise ValueError('IMPER_4B, SWMAN, WSCAP, WLDIP, INTWL contain nulls')
+    s = df['IMPEND']
+    s = _MANSECWATLVL_coerce_1(s)
+    df['IMPEND'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'IMPEND' + ' contains nulls')
+    return df
+
+
+def validate_MISC(df):
+    columns = df.columns
+    if 'LDIS' not in columns:
+        raise ValueError('column ' + 'LDIS' + ' is missing')
+    if 'KF' not in columns:
+        raise ValueError('column ' + 'KF' + ' is missing')
+    if 'DECPOT' not in columns:
+        raise ValueError('column ' + 'DECPOT' + ' is missing')
+    if 'FDEPTH' not in columns:
+        raise ValueError('column ' + 'FDEPTH' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'LDIS': 'float64', 'KF': 'float64', 'DECPOT': 'float64', 'FDEPTH': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['LDIS', 'KF', 'DECPOT', 'FDEPTH']].isna().to_numpy().any():
+        raise ValueError('LDIS, KF, DECPOT, FDEPTH contain nulls')
+    return df
+
+
+_MRFTB_lower_0 = np.array([0.0, 1.0], dtype='float64')
+_MRFTB_upper_0 = np.array([2.0, 5.0], dtype='float64')
+
+
+def validate_MRFTB(df):
+    columns = df.columns
+    if 'DVS' not in columns:
+        raise ValueError('column ' + 'DVS' + ' is missing')
+    if 'MAX_RESP_FACTOR' not in columns:
+        raise ValueError('column ' + 'MAX_RESP_FACTOR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'MAX_RESP_FACTOR': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS', 'MAX_RESP_FACTOR']].isna().to_numpy().any():
+        raise ValueError('DVS, MAX_RESP_FACTOR contain nulls')
+    a = df[['DVS', 'MAX_RESP_FACTOR']].to_numpy()
+    if ((a < _MRFTB_lower_0) | (a > _MRFTB_upper_0)).any():
+        raise ValueError('DVS, MAX_RESP_FACTOR out of bounds')
+    return df
+
+
+_MXPONDTB_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_MXPONDTB(df):
+    columns = df.columns
+    if 'DATEPMX' not in columns:
+        raise ValueError('column ' + 'DATEPMX' + ' is missing')
+    if 'PONDMXTB' not in columns:
+        raise ValueError('column ' + 'PONDMXTB' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'PONDMXTB': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['PONDMXTB']].isna().to_numpy().any():
+        raise ValueError('PONDMXTB contain nulls')
+    s = df['DATEPMX']
+    s = _MXPONDTB_coerce_0(s)
+    df['DATEPMX'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATEPMX' + ' contains nulls')
+    return df
+
+
+_OUTDAT_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_OUTDAT(df):
+    columns = df.columns
+    if 'OUTDAT' not in columns:
+        raise ValueError('column ' + 'OUTDAT' + ' is missing')
+    s = df['OUTDAT']
+    s = _OUTDAT_coerce_0(s)
+    df['OUTDAT'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'OUTDAT' + ' contains nulls')
+    return df
+
+
+_OUTDATIN_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_OUTDATIN(df):
+    columns = df.columns
+    if 'OUTDATIN' not in columns:
+        raise ValueError('column ' + 'OUTDATIN' + ' is missing')
+    s = df['OUTDATIN']
+    s = _OUTDATIN_coerce_0(s)
+    df['OUTDATIN'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'OUTDATIN' + ' contains nulls')
+    return df
+
+
+_PRIWATLVL_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_PRIWATLVL(df):
+    columns = df.columns
+    if 'DATE1' not in columns:
+        raise ValueError('column ' + 'DATE1' + ' is missing')
+    if 'WLP' not in columns:
+        raise ValueError('column ' + 'WLP' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'WLP': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['WLP']].isna().to_numpy().any():
+        raise ValueError('WLP contain nulls')
+    s = df['DATE1']
+    s = _PRIWATLVL_coerce_0(s)
+    df['DATE1'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE1' + ' contains nulls')
+    return df
+
+
+_QBOT2_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_QBOT2(df):
+    columns = df.columns
+    if 'DATE2' not in columns:
+        raise ValueError('column ' + 'DATE2' + ' is missing')
+    if 'QBOT2' not in columns:
+        raise ValueError('column ' + 'QBOT2' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'QBOT2': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['QBOT2']].isna().to_numpy().any():
+        raise ValueError('QBOT2 contain nulls')
+    s = df['DATE2']
+    s = _QBOT2_coerce_0(s)
+    df['DATE2'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE2' + ' contains nulls')
+    return df
+
+
+_QBOT4_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_QBOT4(df):
+    columns = df.columns
+    if 'DATE4' not in columns:
+        raise ValueError('column ' + 'DATE4' + ' is missing')
+    if 'QBOT4' not in columns:
+        raise ValueError('column ' + 'QBOT4' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'QBOT4': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['QBOT4']].isna().to_numpy().any():
+        raise ValueError('QBOT4 contain nulls')
+    s = df['DATE4']
+    s = _QBOT4_coerce_0(s)
+    df['DATE4'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE4' + ' contains nulls')
+    return df
+
+
+def validate_QDRNTB(df):
+    columns = df.columns
+    if 'QDRAIN' not in columns:
+        raise ValueError('column ' + 'QDRAIN' + ' is missing')
+    if 'GWL' not in columns:
+        raise ValueError('column ' + 'GWL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'QDRAIN': 'float64', 'GWL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['QDRAIN', 'GWL']].isna().to_numpy().any():
+        raise ValueError('QDRAIN, GWL contain nulls')
+    return df
+
+
+def validate_QTAB(df):
+    columns = df.columns
+    if 'HTAB' not in columns:
+        raise ValueError('column ' + 'HTAB' + ' is missing')
+    if 'QTAB' not in columns:
+        raise ValueError('column ' + 'QTAB' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'HTAB': 'float64', 'QTAB': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['HTAB', 'QTAB']].isna().to_numpy().any():
+        raise ValueError('HTAB, QTAB contain nulls')
+    return df
+
+
+def validate_QWEIR(df):
+    columns = df.columns
+    if 'IMPER_4C' not in columns:
+        raise ValueError('column ' + 'IMPER_4C' + ' is missing')
+    if 'HBWEIR' not in columns:
+        raise ValueError('column ' + 'HBWEIR' + ' is missing')
+    if 'ALPHAW' not in columns:
+        raise ValueError('column ' + 'ALPHAW' + ' is missing')
+    if 'BETAW' not in columns:
+        raise ValueError('column ' + 'BETAW' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'IMPER_4C': 'float64', 'HBWEIR': 'float64', 'ALPHAW': 'float64', 'BETAW': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['IMPER_4C', 'HBWEIR', 'ALPHAW', 'BETAW']].isna().to_numpy().any():
+        raise ValueError('IMPER_4C, HBWEIR, ALPHAW, BETAW contain nulls')
+    return df
+
+
+def validate_QWEIRTB(df):
+    columns = df.columns
+    if 'IMPER_4D' not in columns:
+        raise ValueError('column ' + 'IMPER_4D' + ' is missing')
+    if 'IMPTAB' not in columns:
+        raise ValueError('column ' + 'IMPTAB' + ' is missing')
+    if 'HTAB' not in columns:
+        raise ValueError('column ' + 'HTAB' + ' is missing')
+    if 'QTAB' not in columns:
+        raise ValueError('column ' + 'QTAB' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'IMPER_4D': 'float64', 'IMPTAB': 'float64', 'HTAB': 'float64', 'QTAB': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['IMPER_4D', 'IMPTAB', 'HTAB', 'QTAB']].isna().to_numpy().any():
+        raise ValueError('IMPER_4D, IMPTAB, HTAB, QTAB contain nulls')
+    return df
+
+
+_RAINFLUX_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_RAINFLUX_upper_0 = np.array([366.0, 1000.0], dtype='float64')
+
+
+def validate_RAINFLUX(df):
+    columns = df.columns
+    if 'TIME' not in columns:
+        raise ValueError('column ' + 'TIME' + ' is missing')
+    if 'RAINFLUX' not in columns:
+        raise ValueError('column ' + 'RAINFLUX' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'TIME': 'float64', 'RAINFLUX': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['TIME', 'RAINFLUX']].isna().to_numpy().any():
+        raise ValueError('TIME, RAINFLUX contain nulls')
+    a = df[['TIME', 'RAINFLUX']].to_numpy()
+    if ((a < _RAINFLUX_lower_0) | (a > _RAINFLUX_upper_0)).any():
+        raise ValueError('TIME, RAINFLUX out of bounds')
+    return df
+
+
+_RDCTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_RDCTB_upper_0 = np.array([100.0, 1.0], dtype='float64')
+
+
+def validate_RDCTB(df):
+    columns = df.columns
+    if 'RRD' not in columns:
+        raise ValueError('column ' + 'RRD' + ' is missing')
+    if 'RDENS' not in columns:
+        raise ValueError('column ' + 'RDENS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'RRD': 'float64', 'RDENS': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RRD', 'RDENS']].isna().to_numpy().any():
+        raise ValueError('RRD, RDENS contain nulls')
+    a = df[['RRD', 'RDENS']].to_numpy()
+    if ((a < _RDCTB_lower_0) | (a > _RDCTB_upper_0)).any():
+        raise ValueError('RRD, RDENS out of bounds')
+    return df
+
+
+def validate_RDRRTB(df):
+    columns = df.columns
+    if 'RDRR' not in columns:
+        raise ValueError('column ' + 'RDRR' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'RDRR': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RDRR']].isna().to_numpy().any():
+        raise ValueError('RDRR contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['RDRR']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'RDRR' + ' out of bounds')
+    return df
+
+
+def validate_RDRSTB(df):
+    columns = df.columns
+    if 'RDRS' not in columns:
+        raise ValueError('column ' + 'RDRS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'RDRS': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RDRS']].isna().to_numpy().any():
+        raise ValueError('RDRS contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['RDRS']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'RDRS' + ' out of bounds')
+    return df
+
+
+def validate_RDTB(df):
+    columns = df.columns
+    if 'RD' not in columns:
+        raise ValueError('column ' + 'RD' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'RD': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RD']].isna().to_numpy().any():
+        raise ValueError('RD contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['RD']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'RD' + ' out of bounds')
+    if (a > 100.0).any():
+        raise ValueError('column ' + 'RD' + ' out of bounds')
+    return df
+
+
+def validate_RFSETB(df):
+    columns = df.columns
+    if 'RFSE' not in columns:
+        raise ValueError('column ' + 'RFSE' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'RFSE': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RFSE']].isna().to_numpy().any():
+        raise ValueError('RFSE contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['RFSE']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'RFSE' + ' out of bounds')
+    if (a > 1.0).any():
+        raise ValueError('column ' + 'RFSE' + ' out of bounds')
+    return df
+
+
+_RLWTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_RLWTB_upper_0 = np.array([5000.0, 5000.0], dtype='float64')
+
+
+def validate_RLWTB(df):
+    columns = df.columns
+    if 'RW' not in columns:
+        raise ValueError('column ' + 'RW' + ' is missing')
+    if 'RL' not in columns:
+        raise ValueError('column ' + 'RL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'RW': 'float64', 'RL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['RW', 'RL']].isna().to_numpy().any():
+        raise ValueError('RW, RL contain nulls')
+    a = df[['RW', 'RL']].to_numpy()
+    if ((a < _RLWTB_lower_0) | (a > _RLWTB_upper_0)).any():
+        raise ValueError('RW, RL out of bounds')
+    return df
+
+
+_SECWATLVL_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+
+
+def validate_SECWATLVL(df):
+    columns = df.columns
+    if 'DATE2' not in columns:
+        raise ValueError('column ' + 'DATE2' + ' is missing')
+    if 'WLS' not in columns:
+        raise ValueError('column ' + 'WLS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'WLS': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['WLS']].isna().to_numpy().any():
+        raise ValueError('WLS contain nulls')
+    s = df['DATE2']
+    s = _SECWATLVL_coerce_0(s)
+    df['DATE2'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'DATE2' + ' contains nulls')
+    return df
+
+
+_SHORTINTERVALMETEODATA_coerce_0 = Engine.dtype('datetime64[ns]').coerce
+_SHORTINTERVALMETEODATA_allowed_1 = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype='int64')
+
+
+def validate_SHORTINTERVALMETEODATA(df):
+    columns = df.columns
+    if 'Date' not in columns:
+        raise ValueError('column ' + 'Date' + ' is missing')
+    if 'Record' not in columns:
+        raise ValueError('column ' + 'Record' + ' is missing')
+    if 'Rad' not in columns:
+        raise ValueError('column ' + 'Rad' + ' is missing')
+    if 'Temp' not in columns:
+        raise ValueError('column ' + 'Temp' + ' is missing')
+    if 'Hum' not in columns:
+        raise ValueError('column ' + 'Hum' + ' is missing')
+    if 'Wind' not in columns:
+        raise ValueError('column ' + 'Wind' + ' is missing')
+    if 'Rain' not in columns:
+        raise ValueError('column ' + 'Rain' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'Record': 'int64', 'Rad': 'float64', 'Temp': 'float64', 'Hum': 'float64', 'Wind': 'float64', 'Rain': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['Rad', 'Temp', 'Hum', 'Wind', 'Rain']].isna().to_numpy().any():
+        raise ValueError('Rad, Temp, Hum, Wind, Rain contain nulls')
+    s = df['Date']
+    s = _SHORTINTERVALMETEODATA_coerce_0(s)
+    df['Date'] = s
+    if s.isna().any():
+        raise ValueError('column ' + 'Date' + ' contains nulls')
+    s = df['Record']
+    if not np.isin(s.to_numpy(), _SHORTINTERVALMETEODATA_allowed_1).all():
+        raise ValueError('column ' + 'Record' + ' out of bounds')
+    return df
+
+
+def validate_SLATB(df):
+    columns = df.columns
+    if 'SLA' not in columns:
+        raise ValueError('column ' + 'SLA' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'DNR': 'float64', 'SLA': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['SLA']].isna().to_numpy().any():
+        raise ValueError('SLA contain nulls')
+    if 'DVS' in columns:
+        s = df['DVS']
+        if s.isna().any():
+            raise ValueError('column ' + 'DVS' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+        if (a > 2.0).any():
+            raise ValueError('column ' + 'DVS' + ' out of bounds')
+    if 'DNR' in columns:
+        s = df['DNR']
+        if s.isna().any():
+            raise ValueError('column ' + 'DNR' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+        if (a > 366).any():
+            raise ValueError('column ' + 'DNR' + ' out of bounds')
+    s = df['SLA']
+    a = s.to_numpy()
+    if (a < 0.0).any():
+        raise ValueError('column ' + 'SLA' + ' out of bounds')
+    if (a > 1.0).any():
+        raise ValueError('column ' + 'SLA' + ' out of bounds')
+    return df
+
+
+_SOILHYDRFUNC_lower_0 = np.array([0.0, 0.0, 0.0001, 1.001, -25.0, 1e-05, -40.0, 1e-05, 100.0], dtype='float64')
+_SOILHYDRFUNC_upper_0 = np.array([1.0, 1.0, 100.0, 9.0, 25.0, 100000.0, 0.0, 100000.0, 10000.0], dtype='float64')
+
+
+def validate_SOILHYDRFUNC(df):
+    columns = df.columns
+    if 'ORES' not in columns:
+        raise ValueError('column ' + 'ORES' + ' is missing')
+    if 'OSAT' not in columns:
+        raise ValueError('column ' + 'OSAT' + ' is missing')
+    if 'ALFA' not in columns:
+        raise ValueError('column ' + 'ALFA' + ' is missing')
+    if 'NPAR' not in columns:
+        raise ValueError('column ' + 'NPAR' + ' is missing')
+    if 'LEXP' not in columns:
+        raise ValueError('column ' + 'LEXP' + ' is missing')
+    if 'KSATFIT' not in columns:
+        raise ValueError('column ' + 'KSATFIT' + ' is missing')
+    if 'H_ENPR' not in columns:
+        raise ValueError('column ' + 'H_ENPR' + ' is missing')
+    if 'KSATEXM' not in columns:
+        raise ValueError('column ' + 'KSATEXM' + ' is missing')
+    if 'BDENS' not in columns:
+        raise ValueError('column ' + 'BDENS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ORES': 'float64', 'OSAT': 'float64', 'ALFA': 'float64', 'NPAR': 'float64', 'LEXP': 'float64', 'KSATFIT': 'float64', 'H_ENPR': 'float64', 'KSATEXM': 'float64', 'BDENS': 'float64', 'ALFAW': 'float64'}
+    casts = {k: v for k, v in casts.items() if k in columns and dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['ORES', 'OSAT', 'ALFA', 'NPAR', 'LEXP', 'KSATFIT', 'H_ENPR', 'KSATEXM', 'BDENS']].isna().to_numpy().any():
+        raise ValueError('ORES, OSAT, ALFA, NPAR, LEXP, KSATFIT, H_ENPR, KSATEXM, BDENS contain nulls')
+    if 'ALFAW' in columns:
+        s = df['ALFAW']
+        if s.isna().any():
+            raise ValueError('column ' + 'ALFAW' + ' contains nulls')
+        a = s.to_numpy()
+        if (a < 0.0001).any():
+            raise ValueError('column ' + 'ALFAW' + ' out of bounds')
+        if (a > 100.0).any():
+            raise ValueError('column ' + 'ALFAW' + ' out of bounds')
+    a = df[['ORES', 'OSAT', 'ALFA', 'NPAR', 'LEXP', 'KSATFIT', 'H_ENPR', 'KSATEXM', 'BDENS']].to_numpy()
+    if ((a < _SOILHYDRFUNC_lower_0) | (a > _SOILHYDRFUNC_upper_0)).any():
+        raise ValueError('ORES, OSAT, ALFA, NPAR, LEXP, KSATFIT, H_ENPR, KSATEXM, BDENS out of bounds')
+    return df
+
+
+_SOILPROFILE_lower_0 = np.array([1, 1, 1], dtype='int64')
+_SOILPROFILE_upper_0 = np.array([9223372036854775807, 9223372036854775807, 9223372036854775807], dtype='int64')
+_SOILPROFILE_lower_1 = np.array([0.0, 0.0], dtype='float64')
+_SOILPROFILE_upper_1 = np.array([10000.0, 1000.0], dtype='float64')
+
+
+def validate_SOILPROFILE(df):
+    columns = df.columns
+    if 'ISOILLAY' not in columns:
+        raise ValueError('column ' + 'ISOILLAY' + ' is missing')
+    if 'ISUBLAY' not in columns:
+        raise ValueError('column ' + 'ISUBLAY' + ' is missing')
+    if 'HSUBLAY' not in columns:
+        raise ValueError('column ' + 'HSUBLAY' + ' is missing')
+    if 'HCOMP' not in columns:
+        raise ValueError('column ' + 'HCOMP' + ' is missing')
+    if 'NCOMP' not in columns:
+        raise ValueError('column ' + 'NCOMP' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'ISOILLAY': 'int64', 'ISUBLAY': 'int64', 'HSUBLAY': 'float64', 'HCOMP': 'float64', 'NCOMP': 'int64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['HSUBLAY', 'HCOMP']].isna().to_numpy().any():
+        raise ValueError('HSUBLAY, HCOMP contain nulls')
+    a = df[['ISOILLAY', 'ISUBLAY', 'NCOMP']].to_numpy()
+    if ((a < _SOILPROFILE_lower_0) | (a > _SOILPROFILE_upper_0)).any():
+        raise ValueError('ISOILLAY, ISUBLAY, NCOMP out of bounds')
+    a = df[['HSUBLAY', 'HCOMP']].to_numpy()
+    if ((a < _SOILPROFILE_lower_1) | (a > _SOILPROFILE_upper_1)).any():
+        raise ValueError('HSUBLAY, HCOMP out of bounds')
+    return df
+
+
+def validate_SOILTEXTURES(df):
+    columns = df.columns
+    if 'PSAND' not in columns:
+        raise ValueError('column ' + 'PSAND' + ' is missing')
+    if 'PSILT' not in columns:
+        raise ValueError('column ' + 'PSILT' + ' is missing')
+    if 'PCLAY' not in columns:
+        raise ValueError('column ' + 'PCLAY' + ' is missing')
+    if 'ORGMAT' not in columns:
+        raise ValueError('column ' + 'ORGMAT' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'PSAND': 'float64', 'PSILT': 'float64', 'PCLAY': 'float64', 'ORGMAT': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['PSAND', 'PSILT', 'PCLAY', 'ORGMAT']].isna().to_numpy().any():
+        raise ValueError('PSAND, PSILT, PCLAY, ORGMAT contain nulls')
+    return df
+
+
+_TC1TB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_TC1TB_upper_0 = np.array([2.0, 1.0], dtype='float64')
+
+
+def validate_TC1TB(df):
+    columns = df.columns
+    if 'DVS_TC1' not in columns:
+        raise ValueError('column ' + 'DVS_TC1' + ' is missing')
+    if 'TREL' not in columns:
+        raise ValueError('column ' + 'TREL' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC1': 'float64', 'TREL': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC1', 'TREL']].isna().to_numpy().any():
+        raise ValueError('DVS_TC1, TREL contain nulls')
+    a = df[['DVS_TC1', 'TREL']].to_numpy()
+    if ((a < _TC1TB_lower_0) | (a > _TC1TB_upper_0)).any():
+        raise ValueError('DVS_TC1, TREL out of bounds')
+    return df
+
+
+_TC2TB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_TC2TB_upper_0 = np.array([2.0, 1.0], dtype='float64')
+
+
+def validate_TC2TB(df):
+    columns = df.columns
+    if 'DVS_TC2' not in columns:
+        raise ValueError('column ' + 'DVS_TC2' + ' is missing')
+    if 'RAW' not in columns:
+        raise ValueError('column ' + 'RAW' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC2': 'float64', 'RAW': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC2', 'RAW']].isna().to_numpy().any():
+        raise ValueError('DVS_TC2, RAW contain nulls')
+    a = df[['DVS_TC2', 'RAW']].to_numpy()
+    if ((a < _TC2TB_lower_0) | (a > _TC2TB_upper_0)).any():
+        raise ValueError('DVS_TC2, RAW out of bounds')
+    return df
+
+
+_TC3TB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_TC3TB_upper_0 = np.array([2.0, 1.0], dtype='float64')
+
+
+def validate_TC3TB(df):
+    columns = df.columns
+    if 'DVS_TC3' not in columns:
+        raise ValueError('column ' + 'DVS_TC3' + ' is missing')
+    if 'TAW' not in columns:
+        raise ValueError('column ' + 'TAW' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC3': 'float64', 'TAW': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC3', 'TAW']].isna().to_numpy().any():
+        raise ValueError('DVS_TC3, TAW contain nulls')
+    a = df[['DVS_TC3', 'TAW']].to_numpy()
+    if ((a < _TC3TB_lower_0) | (a > _TC3TB_upper_0)).any():
+        raise ValueError('DVS_TC3, TAW out of bounds')
+    return df
+
+
+_TC4TB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_TC4TB_upper_0 = np.array([2.0, 500.0], dtype='float64')
+
+
+def validate_TC4TB(df):
+    columns = df.columns
+    if 'DVS_TC4' not in columns:
+        raise ValueError('column ' + 'DVS_TC4' + ' is missing')
+    if 'DWA' not in columns:
+        raise ValueError('column ' + 'DWA' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC4': 'float64', 'DWA': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC4', 'DWA']].isna().to_numpy().any():
+        raise ValueError('DVS_TC4, DWA contain nulls')
+    a = df[['DVS_TC4', 'DWA']].to_numpy()
+    if ((a < _TC4TB_lower_0) | (a > _TC4TB_upper_0)).any():
+        raise ValueError('DVS_TC4, DWA out of bounds')
+    return df
+
+
+_TC7TB_lower_0 = np.array([0.0, -1000.0], dtype='float64')
+_TC7TB_upper_0 = np.array([2.0, -100.0], dtype='float64')
+
+
+def validate_TC7TB(df):
+    columns = df.columns
+    if 'DVS_TC7' not in columns:
+        raise ValueError('column ' + 'DVS_TC7' + ' is missing')
+    if 'HCRI' not in columns:
+        raise ValueError('column ' + 'HCRI' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC7': 'float64', 'HCRI': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC7', 'HCRI']].isna().to_numpy().any():
+        raise ValueError('DVS_TC7, HCRI contain nulls')
+    a = df[['DVS_TC7', 'HCRI']].to_numpy()
+    if ((a < _TC7TB_lower_0) | (a > _TC7TB_upper_0)).any():
+        raise ValueError('DVS_TC7, HCRI out of bounds')
+    return df
+
+
+_TC8TB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_TC8TB_upper_0 = np.array([2.0, 1.0], dtype='float64')
+
+
+def validate_TC8TB(df):
+    columns = df.columns
+    if 'DVS_TC8' not in columns:
+        raise ValueError('column ' + 'DVS_TC8' + ' is missing')
+    if 'TCRI' not in columns:
+        raise ValueError('column ' + 'TCRI' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS_TC8': 'float64', 'TCRI': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS_TC8', 'TCRI']].isna().to_numpy().any():
+        raise ValueError('DVS_TC8, TCRI contain nulls')
+    a = df[['DVS_TC8', 'TCRI']].to_numpy()
+    if ((a < _TC8TB_lower_0) | (a > _TC8TB_upper_0)).any():
+        raise ValueError('DVS_TC8, TCRI out of bounds')
+    return df
+
+
+_TMNFTB_lower_0 = np.array([-10.0, 0.0], dtype='float64')
+_TMNFTB_upper_0 = np.array([50.0, 1.0], dtype='float64')
+
+
+def validate_TMNFTB(df):
+    columns = df.columns
+    if 'TMNR' not in columns:
+        raise ValueError('column ' + 'TMNR' + ' is missing')
+    if 'TMNF' not in columns:
+        raise ValueError('column ' + 'TMNF' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'TMNR': 'float64', 'TMNF': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['TMNR', 'TMNF']].isna().to_numpy().any():
+        raise ValueError('TMNR, TMNF contain nulls')
+    a = df[['TMNR', 'TMNF']].to_numpy()
+    if ((a < _TMNFTB_lower_0) | (a > _TMNFTB_upper_0)).any():
+        raise ValueError('TMNR, TMNF out of bounds')
+    return df
+
+
+_TMPFTB_lower_0 = np.array([-10.0, 0.0], dtype='float64')
+_TMPFTB_upper_0 = np.array([50.0, 1.0], dtype='float64')
+
+
+def validate_TMPFTB(df):
+    columns = df.columns
+    if 'TAVD' not in columns:
+        raise ValueError('column ' + 'TAVD' + ' is missing')
+    if 'TMPF' not in columns:
+        raise ValueError('column ' + 'TMPF' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'TAVD': 'float64', 'TMPF': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['TAVD', 'TMPF']].isna().to_numpy().any():
+        raise ValueError('TAVD, TMPF contain nulls')
+    a = df[['TAVD', 'TMPF']].to_numpy()
+    if ((a < _TMPFTB_lower_0) | (a > _TMPFTB_upper_0)).any():
+        raise ValueError('TAVD, TMPF out of bounds')
+    return df
+
+
+_WRTB_lower_0 = np.array([0.0, 0.0], dtype='float64')
+_WRTB_upper_0 = np.array([2.0, 10.0], dtype='float64')
+
+
+def validate_WRTB(df):
+    columns = df.columns
+    if 'DVS' not in columns:
+        raise ValueError('column ' + 'DVS' + ' is missing')
+    if 'W_ROOT_SS' not in columns:
+        raise ValueError('column ' + 'W_ROOT_SS' + ' is missing')
+    dtypes = df.dtypes
+    casts = {'DVS': 'float64', 'W_ROOT_SS': 'float64'}
+    casts = {k: v for k, v in casts.items() if dtypes[k] != v}
+    if casts:
+        df = df.astype(casts)
+    if df[['DVS', 'W_ROOT_SS']].isna().to_numpy().any():
+        raise ValueError('DVS, W_ROOT_SS contain nulls')
+    a = df[['DVS', 'W_ROOT_SS']].to_numpy()
+    if ((a < _WRTB_lower_0) | (a > _WRTB_upper_0)).any():
+        raise ValueError('DVS, W_ROOT_SS out of bounds')
+    return df
+
+
+VALIDATORS = {
+    'AMAXTB': validate_AMAXTB,
+    'CFTB': validate_CFTB,
+    'CHTB': validate_CHTB,
+    'CO2AMAXTB': validate_CO2AMAXTB,
+    'CO2EFFTB': validate_CO2EFFTB,
+    'CO2TRATB': validate_CO2TRATB,
+    'CROPROTATION': validate_CROPROTATION,
+    'CSEEPARR': validate_CSEEPARR,
+    'DAILYMETEODATA': validate_DAILYMETEODATA,
+    'DATEHARVEST': validate_DATEHARVEST,
+    'DATET': validate_DATET,
+    'DATOWLTB1': validate_DATOWLTB1,
+    'DATOWLTB2': validate_DATOWLTB2,
+    'DATOWLTB3': validate_DATOWLTB3,
+    'DATOWLTB4': validate_DATOWLTB4,
+    'DATOWLTB5': validate_DATOWLTB5,
+    'DC1TB': validate_DC1TB,
+    'DC2TB': validate_DC2TB,
+    'DETAILEDRAINFALL': validate_DETAILEDRAINFALL,
+    'DMGRZTB': validate_DMGRZTB,
+    'DMMOWDELAY': validate_DMMOWDELAY,
+    'DMMOWTB': validate_DMMOWTB,
+    'DRAINAGELEVELTOPPARAMS': validate_DRAINAGELEVELTOPPARAMS,
+    'DRNTB': validate_DRNTB,
+    'DTSMTB': validate_DTSMTB,
+    'FLTB': validate_FLTB,
+    'FOTB': validate_FOTB,
+    'FRTB': validate_FRTB,
+    'FSTB': validate_FSTB,
+    'GCTB': validate_GCTB,
+    'GWLEVEL': validate_GWLEVEL,
+    'HAQUIF': validate_HAQUIF,
+    'HBOT5': validate_HBOT5,
+    'INIPRESSUREHEAD': validate_INIPRESSUREHEAD,
+    'INISSOIL': validate_INISSOIL,
+    'INITSOILTEMP': validate_INITSOILTEMP,
+    'INTERTB': validate_INTERTB,
+    'IRRIGEVENTS': validate_IRRIGEVENTS,
+    'KYTB': validate_KYTB,
+    'LSDATB': validate_LSDATB,
+    'LSDBTB': validate_LSDBTB,
+    'MANSECWATLVL': validate_MANSECWATLVL,
+    'MISC': validate_MISC,
+    'MRFTB': validate_MRFTB,
+    'MXPONDTB': validate_MXPONDTB,
+    'OUTDAT': validate_OUTDAT,
+    'OUTDATIN': validate_OUTDATIN,
+    'PRIWATLVL': validate_PRIWATLVL,
+    'QBOT2': validate_QBOT2,
+    'QBOT4': validate_QBOT4,
+    'QDRNTB': validate_QDRNTB,
+    'QTAB': validate_QTAB,
+    'QWEIR': validate_QWEIR,
+    'QWEIRTB': validate_QWEIRTB,
+    'RAINFLUX': validate_RAINFLUX,
+    'RDCTB': validate_RDCTB,
+    'RDRRTB': validate_RDRRTB,
+    'RDRSTB': validate_RDRSTB,
+    'RDTB': validate_RDTB,
+    'RFSETB': validate_RFSETB,
+    'RLWTB': validate_RLWTB,
+    'SECWATLVL': validate_SECWATLVL,
+    'SHORTINTERVALMETEODATA': validate_SHORTINTERVALMETEODATA,
+    'SLATB': validate_SLATB,
+    'SOILHYDRFUNC': validate_SOILHYDRFUNC,
+    'SOILPROFILE': validate_SOILPROFILE,
+    'SOILTEXTURES': validate_SOILTEXTURES,
+    'TC1TB': validate_TC1TB,
+    'TC2TB': validate_TC2TB,
+    'TC3TB': validate_TC3TB,
+    'TC4TB': validate_TC4TB,
+    'TC7TB': validate_TC7TB,
+    'TC8TB': validate_TC8TB,
+    'TMNFTB': validate_TMNFTB,
+    'TMPFTB': validate_TMPFTB,
+    'WRTB': validate_WRTB,
+}
@@ -25,7 +25,14 @@
     get_day_data_dataframe as _get_day_data_dataframe,
     get_hour_data_dataframe as _get_hour_data_dataframe,
 )
-from numpy import exp as _exp
+from numpy import (
+    asarray as _asarray,
+    exp as _exp,
+)
+from pandas import (
+    Series as _Series,
+    factorize as _factorize,
+)
 from pydantic import (
     Field as _Field,
     PrivateAttr as _PrivateAttr,
@@ -168,7 +175,14 @@ class Meteorology(_PySWAPBaseModel, _SerializableMixin, _YAMLValidatorMixin):
 
     @property
     def met(self):
-        return self.metfile.content.to_csv(index=False, lineterminator="\n")
+        content = self.metfile.content
+        # Day and month are stored as integers; write them zero-padded
+        padded = {
+            col: content[col].astype(str).str.zfill(2)
+            for col in ("DD", "MM")
+            if col in content.columns
+        }
+        return content.assign(**padded).to_csv(index=False, lineterminator="\n")
 
     def model_post_init(self, __context=None):
         """Set lat, and alt from `meteo_location` if Location object is provided."""
@@ -196,6 +210,19 @@ def write_met(self, path: str):
         self.metfile.save_file(string=self.met, fname=self.metfile.metfil, path=path)
 
 
+def _quote_station(station: _Series) -> _Series:
+    """Put quotes around the station names that do not have them yet.
+
+    The names are quoted once per station rather than once per row; a table
+    usually holds the records of a single station.
+    """
+    codes, names = _factorize(station.astype(str))
+    quoted = [name if name.startswith("'") else f"'{name}'" for name in names]
+    values = _asarray(quoted, dtype=object)[codes]
+    column: _Series = _Series(values, index=station.index)
+    return column
+
+
 def metfile_from_csv(metfil: str, csv_path: str, **kwargs) -> MetFile:
     """Method for loading daily meteorological data from a CSV file.
 
@@ -214,12 +241,17 @@ def metfile_from_csv(metfil: str, csv_path: str, **kwargs) -> MetFile:
     """
     # Create table from csv
     df = load_csv(csv_path, **kwargs)
-    table = DAILYMETEODATA.create(data=df.to_dict())
+    df.columns = df.columns.str.upper()
+
+    # Dates are validated as integers, so drop quotes written around them
+    for col in ("DD", "MM", "YYYY"):
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].str.strip("'")
 
     # Make sure Station column has quotes
-    table.loc[:, "STATION"] = table.STATION.apply(
-        lambda x: f"'{x}'" if not str(x).startswith("'") else x
-    )
+    df["STATION"] = _quote_station(df["STATION"])
+
+    table = DAILYMETEODATA.create(data=df)
 
     return MetFile(metfil=metfil, content=table)
 
@@ -287,7 +319,7 @@ def metfile_from_knmi(
     df = df.rename(columns=variables)
 
     # Set -1 to zero in RAIN and SUNH columns (rain or sun hours < 0.05 mm and h respectively)
-    df["RAIN"] = df["RAIN"].apply(lambda x: 0 if x == -1 else x)
+    df["RAIN"] = df["RAIN"].mask(df["RAIN"] == -1, 0)
 
     # Changing unit of data (see knmi documentation)
     factor = {
@@ -300,19 +332,19 @@ def metfile_from_knmi(
         "ETREF": 0.1,  # Convert from 1 to 0.1 mm
         "WET": (0.1 / 24),  # Convert from 0.1 h to fraction of day
     }
-    df = df.apply(lambda x: x * factor.get(x.name, 1))
+    df = df.assign(**{k: df[k] * v for k, v in factor.items() if k in df})
 
     # Convert from fraction to kPa according to Allen et al. (1998)
-    es_min = 0.6108 * _exp(17.27 * df["TMIN"].values / (df["TMIN"].values + 237.3))
-    es_max = 0.6108 * _exp(17.27 * df["TMAX"].values / (df["TMAX"].values + 237.3))
+    tmin = df["TMIN"].to_numpy()
+    tmax = df["TMAX"].to_numpy()
+    es_min = 0.6108 * _exp(17.27 * tmin / (tmin + 237.3))
+    es_max = 0.6108 * _exp(17.27 * tmax / (tmax + 237.3))
     df["HUM"] = (es_min + es_max) / 2 * df["HUM"]
 
     # Make sure Station column has quotes
-    df["STATION"] = df["STATION"].apply(
-        lambda x: f"'{x}'" if not str(x).startswith("'") else x
-    )
+    df["STATION"] = _quote_station(df["STATION"])
 
     # Make MeteoData table
-    table = DAILYMETEODATA.create(data=df.to_dict())
+    table = DAILYMETEODATA.create(data=df)
 
     return MetFile(metfil=metfil, content=table)
@@ -1,11 +1,13 @@
 # pyright: reportInvalidTypeForm=false
 
-from typing import Literal
+from typing import ClassVar, Literal
 
+import pandas as pd
 import pandera as pa
 from pandera.typing import Series
 
-from pyswap.core.basemodel import BaseTableModel
+from pyswap.components._generated_validators import VALIDATORS
+from pyswap.core.basemodel import BaseTableModel, column_alias
 from pyswap.core.valueranges import DVSRANGE, UNITRANGE, YEARRANGE
 
 __all__ = [
@@ -41,9 +43,23 @@
     "CO2AMAXTB",
 ]  #  TODO: needs update?
 
+
+def _generated_validator(cls):
+    """Attach the validator generated for the table ahead of time.
+
+    The validators are generated from the schemas by
+    pyswap.components._gen_validators. Tables without one are validated by
+    pandera only.
+    """
+    validator = VALIDATORS.get(cls.__name__)
+    if validator is not None:
+        cls._fast_validate = staticmethod(validator)
+    return cls
+
+
 # %% ++++++++++++++++++++++++++++ CROP TABLES ++++++++++++++++++++++++++++
 
-crop_tables = [
+crop_tables = frozenset({
     "DATEHARVEST",
     "RDTB",
     "RDCTB",
@@ -84,9 +100,10 @@
     "CO2EFFTB",
     "CO2TRATB",
     "CO2AMAXTB",
-]
+})
 
 
+@_generated_validator
 class DATEHARVEST(BaseTableModel):
     """Date of harvest
 
@@ -97,6 +114,7 @@ class DATEHARVEST(BaseTableModel):
     DATEHARVEST: Series[pa.DateTime]
 
 
+@_generated_validator
 class RDTB(BaseTableModel):
     """Rooting Depth [0..1000 cm, R], as a function of development stage [0..2 -, R].
 
@@ -110,6 +128,7 @@ class RDTB(BaseTableModel):
     RD: Series[float] = pa.Field(ge=0.0, le=100.0)
 
 
+@_generated_validator
 class RDCTB(BaseTableModel):
     """List root density [0..100 cm/cm3, R] as function of relative rooting depth [0..1 -, R]
 
@@ -123,6 +142,7 @@ class RDCTB(BaseTableModel):
     RDENS: Series[float] = pa.Field(**UNITRANGE)
 
 
+@_generated_validator
 class GCTB(BaseTableModel):
     """Leaf Area Index [0..12 (m2 leaf)/(m2 soil), R], as function of dev. stage [0..2 -, R]
 
@@ -135,6 +155,7 @@ class GCTB(BaseTableModel):
     LAI: Series[float] = pa.Field(ge=0.0, le=12.0)
 
 
+@_generated_validator
 class CFTB(BaseTableModel):
     """Crop factor [0..2 [-], R], as function of dev. stage [0..2 -, R]
 
@@ -149,6 +170,7 @@ class CFTB(BaseTableModel):
     CF: Series[float] | None
 
 
+@_generated_validator
 class CHTB(BaseTableModel):
     """Crop Height [0..1.d4 cm, R], as function of dev. stage [0..2 -, R]
 
@@ -166,6 +188,7 @@ class CHTB(BaseTableModel):
     CH: Series[float] | None
 
 
+@_generated_validator
 class INTERTB(BaseTableModel):
     """Interception parameters for closed forest canopies (SWINTER=2).
 
@@ -186,6 +209,7 @@ class INTERTB(BaseTableModel):
     AVEVAP: Series[float] = pa.Field(ge=0.0, le=10.0)
 
 
+@_generated_validator
 class KYTB(BaseTableModel):
     """Yield response factor [0..5 -, R], as function of dev. stage [0..2 -, R]
 
@@ -198,6 +222,7 @@ class KYTB(BaseTableModel):
     KY: Series[float] = pa.Field(ge=0.0, le=5.0)
 
 
+@_generated_validator
 class MRFTB(BaseTableModel):
     """Ratio root total respiration / maintenance respiration [1..5.0 -, R]
 
@@ -210,6 +235,7 @@ class MRFTB(BaseTableModel):
     MAX_RESP_FACTOR: Series[float] = pa.Field(ge=1.0, le=5.0)
 
 
+@_generated_validator
 class WRTB(BaseTableModel):
     """dry weight of roots at soil surface [0..10 kg/m3, R], as a function of development stage [0..2 -,R]
 
@@ -222,6 +248,7 @@ class WRTB(BaseTableModel):
     W_ROOT_SS: Series[float] = pa.Field(ge=0.0, le=10.0)
 
 
+@_generated_validator
 class CROPROTATION(BaseTableModel):
     """Crop rotation settings
 
@@ -243,6 +270,7 @@ class CROPROTATION(BaseTableModel):
 
 
 # WOFOST-specific tables
+@_generated_validator
 class DTSMTB(BaseTableModel):
     """increase in temperature sum [0..60 oC, R] as function of daily average temperature [0..100 oC, R]
 
@@ -255,6 +283,7 @@ class DTSMTB(BaseTableModel):
     DTSM: Series[float] = pa.Field(ge=0.0, le=60.0)
 
 
+@_generated_validator
 class SLATB(BaseTableModel):
     """Specific leaf area [0..1 ha/kg, R] as function of crop development stage [0..2 -, R]
 
@@ -268,6 +297,7 @@ class SLATB(BaseTableModel):
     SLA: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class AMAXTB(BaseTableModel):
     """maximum CO2 assimilation rate [0..100 kg/ha/hr, R] as function of development stage [0..2 -, R]
 
@@ -281,6 +311,7 @@ class AMAXTB(BaseTableModel):
     AMAX: Series[float] = pa.Field(ge=0.0, le=100.0)
 
 
+@_generated_validator
 class TMPFTB(BaseTableModel):
     """reduction factor of AMAX [-, R] as function of average day temperature [-10..50 oC, R]
 
@@ -293,6 +324,7 @@ class TMPFTB(BaseTableModel):
     TMPF: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class TMNFTB(BaseTableModel):
     """reduction factor of AMAX [-, R] as function of minimum day temperature [-10..50 oC, R]
 
@@ -305,6 +337,7 @@ class TMNFTB(BaseTableModel):
     TMNF: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class RFSETB(BaseTableModel):
     """reduction factor of senescence [-, R] as function of development stage [0..2 -, R]
 
@@ -318,6 +351,7 @@ class RFSETB(BaseTableModel):
     RFSE: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class FRTB(BaseTableModel):
     """fraction of total dry matter increase partitioned to the roots [kg/kg, R]
 
@@ -331,6 +365,7 @@ class FRTB(BaseTableModel):
     FR: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class FLTB(BaseTableModel):
     """fraction of total above ground dry matter increase partitioned to the leaves [kg/kg, R]
 
@@ -344,6 +379,7 @@ class FLTB(BaseTableModel):
     FL: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class FSTB(BaseTableModel):
     """fraction of total above ground dry matter increase partitioned to the stems [kg/kg, R]
 
@@ -357,6 +393,7 @@ class FSTB(BaseTableModel):
     FS: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class FOTB(BaseTableModel):
     """fraction of total above ground dry matter increase partitioned to the storage organs [kg/kg, R]
 
@@ -369,6 +406,7 @@ class FOTB(BaseTableModel):
     FO: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class RDRRTB(BaseTableModel):
     """relative death rates of roots [kg/kg/d] as function of development stage [0..2 -, R]
 
@@ -382,6 +420,7 @@ class RDRRTB(BaseTableModel):
     RDRR: Series[float] = pa.Field(ge=0.0)
 
 
+@_generated_validator
 class RDRSTB(BaseTableModel):
     """relative death rates of stems [kg/kg/d] as function of development stage [0..2 -, R]
 
@@ -395,6 +434,7 @@ class RDRSTB(BaseTableModel):
     RDRS: Series[float] = pa.Field(ge=0.0)
 
 
+@_generated_validator
 class DMGRZTB(BaseTableModel):
     """threshold of above ground dry matter [0..1d6 kg DM/ha, R] to trigger grazing as function of daynumber [1..366 d, R]
 
@@ -407,6 +447,7 @@ class DMGRZTB(BaseTableModel):
     DMGRZ: Series[float] = pa.Field(ge=0.0, le=1.0e6)
 
 
+@_generated_validator
 class LSDATB(BaseTableModel):
     """Actual livestock density of each grazing period
 
@@ -423,6 +464,9 @@ class LSDATB(BaseTableModel):
     LSDA: Series[float] = pa.Field(ge=0.0, le=1000.0)
 
 
+# SWAP writes the column as LSDb; create() upper-cases column names
+@_generated_validator
+@column_alias("LSDB", "LSDb")
 class LSDBTB(BaseTableModel):
     """Relation between livestock density, number of grazing days and dry matter uptake
 
@@ -439,6 +483,7 @@ class LSDBTB(BaseTableModel):
     LOSSGRAZING: Series[float] = pa.Field(ge=0.0, le=1000.0)
 
 
+@_generated_validator
 class RLWTB(BaseTableModel):
     """rooting depth RL [0..5000 cm, R] as function of root weight RW [0..5000 kg DM/ha, R]
 
@@ -451,6 +496,7 @@ class RLWTB(BaseTableModel):
     RL: Series[float] = pa.Field(ge=0.0, le=5000.0)
 
 
+@_generated_validator
 class DMMOWTB(BaseTableModel):
     """List threshold of above ground dry matter [0..1d6 kg DM/ha, R] to trigger mowing as function of daynumber [1..366 d, R]
 
@@ -468,6 +514,7 @@ class DMMOWTB(BaseTableModel):
     DMMOW: Series[float] = pa.Field(ge=0.0, le=1.0e6)
 
 
+@_generated_validator
 class DMMOWDELAY(BaseTableModel):
     """Relation between dry matter harvest [0..1d6 kg/ha, R] and days of delay in regrowth [0..366 d, I] after mowing
 
@@ -480,6 +527,7 @@ class DMMOWDELAY(BaseTableModel):
     DAYDELAY: Series[int] = pa.Field(**YEARRANGE)
 
 
+@_generated_validator
 class IRRIGEVENTS(BaseTableModel):
     """information for each fixed irrigation event.
 
@@ -500,6 +548,7 @@ class IRRIGEVENTS(BaseTableModel):
     IRTYPE: Series[int] = pa.Field(ge=0, le=1)
 
 
+@_generated_validator
 class TC1TB(BaseTableModel):
     """tc1tb option table"""
 
@@ -507,6 +556,7 @@ class TC1TB(BaseTableModel):
     TREL: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class TC2TB(BaseTableModel):
     """tc2tb option table"""
 
@@ -514,6 +564,7 @@ class TC2TB(BaseTableModel):
     RAW: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class TC3TB(BaseTableModel):
     """tc3tb option table"""
 
@@ -521,6 +572,7 @@ class TC3TB(BaseTableModel):
     TAW: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class TC4TB(BaseTableModel):
     """tc4tb option table"""
 
@@ -528,6 +580,7 @@ class TC4TB(BaseTableModel):
     DWA: Series[float] = pa.Field(ge=0.0, le=500.0)
 
 
+@_generated_validator
 class TC7TB(BaseTableModel):
     """tc7tb option table"""
 
@@ -535,6 +588,7 @@ class TC7TB(BaseTableModel):
     HCRI: Series[float] = pa.Field(ge=-1000.0, le=-100.0)
 
 
+@_generated_validator
 class TC8TB(BaseTableModel):
     """tc8tb option table"""
 
@@ -542,16 +596,19 @@ class TC8TB(BaseTableModel):
     TCRI: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class DC1TB(BaseTableModel):
     DVS_DC1: Series[float]
     DI: Series[float]
 
 
+@_generated_validator
 class DC2TB(BaseTableModel):
     DVS_DC2: Series[float]
     FID: Series[float]
 
 
+@_generated_validator
 class CO2EFFTB(BaseTableModel):
     """Correction factor light use efficiency for change in CO2 concentration."""
 
@@ -559,6 +616,7 @@ class CO2EFFTB(BaseTableModel):
     FACTOR: Series[float]
 
 
+@_generated_validator
 class CO2TRATB(BaseTableModel):
     """Correction factor maximum transpiration rate for change in CO2 concentration."""
 
@@ -566,6 +624,7 @@ class CO2TRATB(BaseTableModel):
     FACTOR: Series[float]
 
 
+@_generated_validator
 class CO2AMAXTB(BaseTableModel):
     """Correction factor assimilation rate for change in CO2 concentration."""
 
@@ -575,14 +634,15 @@ class CO2AMAXTB(BaseTableModel):
 
 # %% ++++++++++++++++++++++++++++ METEO TABLES ++++++++++++++++++++++++++++
 
-meteo_tables = [
+meteo_tables = frozenset({
     "DAILYMETEODATA",
     "SHORTINTERVALMETEODATA",
     "DETAILEDRAINFALL",
     "RAINFLUX",
-]
+})
 
 
+@_generated_validator
 class DAILYMETEODATA(BaseTableModel):
     """Format detailed daily meteo data.
 
@@ -591,19 +651,31 @@ class DAILYMETEODATA(BaseTableModel):
     """
 
     STATION: Series[str]
-    DD: Series[str]
-    MM: Series[str]
-    YYYY: Series[str]
+    DD: Series[int] = pa.Field(ge=1, le=31)
+    MM: Series[int] = pa.Field(ge=1, le=12)
+    YYYY: Series[int] = pa.Field(ge=1800, le=2200)
     RAD: Series[float]
     TMIN: Series[float]
     TMAX: Series[float]
     HUM: Series[float]
     WIND: Series[float]
-    RAIN: Series[float]
+    RAIN: Series[float] = pa.Field(ge=0.0)
     ETREF: Series[float]
     WET: Series[float]
 
+    _storage_dtypes: ClassVar[dict[str, str]] = {
+        "DD": "int8",
+        "MM": "int8",
+        "YYYY": "int16",
+    }
+
+    @pa.dataframe_check
+    def tmin_not_above_tmax(cls, df: pd.DataFrame) -> Series[bool]:
+        """Minimum temperature cannot exceed the maximum of the same day."""
+        return df["TMIN"] <= df["TMAX"]
+
 
+@_generated_validator
 class SHORTINTERVALMETEODATA(BaseTableModel):
     Date: Series[pa.DateTime]
     Record: Series[int] = pa.Field(ge=1, le=10)
@@ -614,6 +686,7 @@ class SHORTINTERVALMETEODATA(BaseTableModel):
     Rain: Series[float]
 
 
+@_generated_validator
 class DETAILEDRAINFALL(BaseTableModel):
     Station: Series[str]
     Day: Series[int]
@@ -623,6 +696,7 @@ class DETAILEDRAINFALL(BaseTableModel):
     Amount: Series[float]
 
 
+@_generated_validator
 class RAINFLUX(BaseTableModel):
     TIME: Series[float] = pa.Field(**YEARRANGE)
     RAINFLUX: Series[float] = pa.Field(ge=0, le=1000.0)
@@ -630,16 +704,17 @@ class RAINFLUX(BaseTableModel):
 
 # %% ++++++++++++++++++++++++++++ SOILWATER TABLES ++++++++++++++++++++++++++++
 
-soilwater_tables = [
+soilwater_tables = frozenset({
     "INIPRESSUREHEAD",
     "MXPONDTB",
     "SOILPROFILE",
     "SOILHYDRFUNC",
     "SOILTEXTURES",
     "INITSOILTEMP",
-]
+})
 
 
+@_generated_validator
 class INIPRESSUREHEAD(BaseTableModel):
     """Initial pressure head [cm, R] as a function of soil layer [1..N, I].
 
@@ -652,6 +727,7 @@ class INIPRESSUREHEAD(BaseTableModel):
     H: Series[float] = pa.Field(ge=-1.0e10, le=1.0e4)
 
 
+@_generated_validator
 class MXPONDTB(BaseTableModel):
     """minimum thickness for runoff PONDMXTB [0..1000 cm, R] as function of time
 
@@ -664,6 +740,7 @@ class MXPONDTB(BaseTableModel):
     PONDMXTB: Series[float]
 
 
+@_generated_validator
 class SOILPROFILE(BaseTableModel):
     """Vertical discretization of soil profile
 
@@ -682,6 +759,7 @@ class SOILPROFILE(BaseTableModel):
     NCOMP: Series[int] = pa.Field(ge=1)
 
 
+@_generated_validator
 class SOILHYDRFUNC(BaseTableModel):
     """Soil hydraulic functions table.
 
@@ -716,6 +794,7 @@ class SOILHYDRFUNC(BaseTableModel):
 # %% ++++++++++++++++++++++++++++ HEAT FLOW TABLES ++++++++++++++++++++++++++++
 
 
+@_generated_validator
 class SOILTEXTURES(BaseTableModel):
     """Table for soil textures.
 
@@ -732,6 +811,7 @@ class SOILTEXTURES(BaseTableModel):
     ORGMAT: float
 
 
+@_generated_validator
 class INITSOILTEMP(BaseTableModel):
     """Table for initial soil temperature.
 
@@ -746,7 +826,7 @@ class INITSOILTEMP(BaseTableModel):
 
 # %% ++++++++++++++++++++++++++++ BOUNDARY TABLES ++++++++++++++++++++++++++++
 
-boundary_tables = [
+boundary_tables = frozenset({
     "GWLEVEL",
     "QBOT2",
     "HAQUIF",
@@ -757,9 +837,10 @@ class INITSOILTEMP(BaseTableModel):
     "CSEEPARR",
     "INISSOIL",
     "MISC",
-]
+})
 
 
+@_generated_validator
 class GWLEVEL(BaseTableModel):
     """Table for groundwater levels.
 
@@ -772,6 +853,7 @@ class GWLEVEL(BaseTableModel):
     GWLEVEL: Series[float]
 
 
+@_generated_validator
 class QBOT2(BaseTableModel):
     """Table for bottom boundary flow.
 
@@ -784,6 +866,7 @@ class QBOT2(BaseTableModel):
     QBOT2: Series[float]
 
 
+@_generated_validator
 class HAQUIF(BaseTableModel):
     """Table for aquifer thickness.
 
@@ -796,6 +879,7 @@ class HAQUIF(BaseTableModel):
     HAQUIF: Series[float]
 
 
+@_generated_validator
 class QBOT4(BaseTableModel):
     """Table for bottom boundary flow.
 
@@ -808,6 +892,7 @@ class QBOT4(BaseTableModel):
     QBOT4: Series[float]
 
 
+@_generated_validator
 class QTAB(BaseTableModel):
     """Table for height of the water table.
 
@@ -820,6 +905,7 @@ class QTAB(BaseTableModel):
     QTAB: Series[float]
 
 
+@_generated_validator
 class HBOT5(BaseTableModel):
     """Table for bottom compartment pressure head.
 
@@ -832,6 +918,7 @@ class HBOT5(BaseTableModel):
     HBOT5: Series[float]
 
 
+@_generated_validator
 class DATET(BaseTableModel):
     """Table for time.
 
@@ -844,6 +931,7 @@ class DATET(BaseTableModel):
     TBOT: Series[float]
 
 
+@_generated_validator
 class CSEEPARR(BaseTableModel):
     """Table for seepage.
 
@@ -856,6 +944,7 @@ class CSEEPARR(BaseTableModel):
     CSEEPARR: Series[float]
 
 
+@_generated_validator
 class INISSOIL(BaseTableModel):
     """Table for capillary rise.
 
@@ -868,6 +957,7 @@ class INISSOIL(BaseTableModel):
     CML: Series[float]
 
 
+@_generated_validator
 class MISC(BaseTableModel):
     """Table for miscellaneous.
 
@@ -884,7 +974,7 @@ class MISC(BaseTableModel):
 
 # %% ++++++++++++++++++++++++++++ DRAINAGE TABLES ++++++++++++++++++++++++++++
 
-drainage_tables = [
+drainage_tables = frozenset({
     "DRNTB",
     "DRAINAGELEVELTOPPARAMS",
     "DATOWLTB1",
@@ -898,9 +988,10 @@ class MISC(BaseTableModel):
     "QWEIRTB",
     "PRIWATLVL",
     "QDRNTB",
-]
+})
 
 
+@_generated_validator
 class DRNTB(BaseTableModel):
     """Drainage characteristics table.
 
@@ -931,6 +1022,7 @@ class DRNTB(BaseTableModel):
     TALUDR: Series[float] = pa.Field(ge=0.01, le=5.0)
 
 
+@_generated_validator
 class DRAINAGELEVELTOPPARAMS(BaseTableModel):
     """Drainage level top parameters table.
 
@@ -948,6 +1040,7 @@ class DRAINAGELEVELTOPPARAMS(BaseTableModel):
     FTOPDISLAY: Series[float] = pa.Field(ge=0.0, le=1.0)
 
 
+@_generated_validator
 class DATOWLTB1(BaseTableModel):
     """Table for drainage water level.
 
@@ -960,6 +1053,7 @@ class DATOWLTB1(BaseTableModel):
     LEVEL1: Series[float]
 
 
+@_generated_validator
 class DATOWLTB2(BaseTableModel):
     """Table for drainage water level.
 
@@ -972,6 +1066,7 @@ class DATOWLTB2(BaseTableModel):
     LEVEL2: Series[float]
 
 
+@_generated_validator
 class DATOWLTB3(BaseTableModel):
     """Table for drainage water level.
 
@@ -984,6 +1079,7 @@ class DATOWLTB3(BaseTableModel):
     LEVEL3: Series[float]
 
 
+@_generated_validator
 class DATOWLTB4(BaseTableModel):
     """Table for drainage water level.
 
@@ -996,6 +1092,7 @@ class DATOWLTB4(BaseTableModel):
     LEVEL4: Series[float]
 
 
+@_generated_validator
 class DATOWLTB5(BaseTableModel):
     """Table for drainage water level.
 
@@ -1008,11 +1105,13 @@ class DATOWLTB5(BaseTableModel):
     LEVEL5: Series[float]
 
 
+@_generated_validator
 class SECWATLVL(BaseTableModel):
     DATE2: Series[pa.DateTime]
     WLS: Series[float]
 
 
+@_generated_validator
 class MANSECWATLVL(BaseTableModel):
     IMPER_4B: Series[float]
     IMPEND: Series[pa.DateTime]
@@ -1022,6 +1121,7 @@ class MANSECWATLVL(BaseTableModel):
     INTWL: Series[float]
 
 
+@_generated_validator
 class QWEIR(BaseTableModel):
     IMPER_4C: Series[float]
     HBWEIR: Series[float]
@@ -1029,6 +1129,7 @@ class QWEIR(BaseTableModel):
     BETAW: Series[float]
 
 
+@_generated_validator
 class QWEIRTB(BaseTableModel):
     IMPER_4D: Series[float]
     IMPTAB: Series[float]
@@ -1036,11 +1137,13 @@ class QWEIRTB(BaseTableModel):
     QTAB: Series[float]
 
 
+@_generated_validator
 class PRIWATLVL(BaseTableModel):
     DATE1: Series[pa.DateTime]
     WLP: Series[float]
 
 
+@_generated_validator
 class QDRNTB(BaseTableModel):
     QDRAIN: Series[float]
     GWL: Series[float]
@@ -1048,9 +1151,10 @@ class QDRNTB(BaseTableModel):
 
 # %% ++++++++++++++++++++++++++++ GENERAL SETTINGS TABLES ++++++++++++++++++++++++++++
 
-general_settings_tables = ["OUTDATIN", "OUTDAT"]
+general_settings_tables = frozenset({"OUTDATIN", "OUTDAT"})
 
 
+@_generated_validator
 class OUTDATIN(BaseTableModel):
     """OUTDATIN table
 
@@ -1061,6 +1165,7 @@ class OUTDATIN(BaseTableModel):
     OUTDATIN: Series[pa.DateTime]
 
 
+@_generated_validator
 class OUTDAT(BaseTableModel):
     """OUTDAT table
 
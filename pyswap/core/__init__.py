@@ -12,6 +12,7 @@
     parsers: Functions to parse SWAP formatted ascii files into pySWAP objects.
     serializers: Functions to fine tune the serializatino of pySWAP objects to
         SWAP formatted ASCII.
+    validators: Compiled validators for frequently validated tables.
     valueranges: Value ranges for pydantic Field objects used in pyswap
         validation.
 
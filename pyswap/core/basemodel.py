@@ -18,14 +18,19 @@
     BaseModel: Base class for pySWAP models. Inherits from Pydantic BaseModel.
     BaseTableModel: Base class for pySWAP models that validate pandas
         DataFrames. Inherits from Pandera DataFrameModel.
+
+Functions:
+    column_alias: Class decorator accepting another spelling of a table column.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 import pandera as pa
+from pandera.engines import pandas_engine
 from pandera.typing import DataFrame
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -55,7 +60,8 @@ def __setattr__(self, name, value):
         to avoid errors when an old swp files is read.
         """
 
-        if name in self.model_fields and self.model_fields[name].frozen:
+        field = type(self).model_fields.get(name)
+        if field is not None and field.frozen:
             return
         super().__setattr__(name, value)
 
@@ -128,18 +134,140 @@ class BaseTableModel(pa.DataFrameModel):
     """Base model for pandas DataFrames.
 
     Methods:
+        validate: Validate a DataFrame, preferring a compiled validator.
         create: Create a validated DataFrame from a dictionary.
+        to_lookup: Resample a relation between two columns to a uniform step.
     """
 
     class Config:
         coerce = True
 
+    # Narrower dtypes the validated columns are stored in, e.g. {"DD": "int8"}.
+    # The cast is applied after validation, so the bounds declared on the
+    # columns guarantee that the values fit.
+    _storage_dtypes: ClassVar[dict[str, str]] = {}
+
+    # Alternative spellings of column names, mapped to the name in the schema.
+    # Set with the column_alias decorator.
+    _column_aliases: ClassVar[dict[str, str]] = {}
+
+    # Formats tried, in order, when parsing string columns declared as dates.
+    _date_formats: ClassVar[tuple[str, ...]] = ("%Y-%m-%d", "%d-%b-%Y")
+
+    # Names of the columns declared as dates, collected when the class is built
+    _date_columns: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the schema of the table once, when the class is created.
+
+        pandera caches the schema, so validate() does not rebuild it; the
+        properties of the columns used on every validation are kept on the
+        class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._date_columns = tuple(
+            name
+            for name, column in cls.to_schema().columns.items()
+            if isinstance(column.dtype, pandas_engine.DateTime)
+        )
+
+    @classmethod
+    def validate(
+        cls,
+        check_obj: pd.DataFrame,
+        head: int | None = None,
+        tail: int | None = None,
+        sample: int | None = None,
+        random_state: int | None = None,
+        lazy: bool = False,
+        inplace: bool = False,
+    ) -> DataFrame:
+        """Validate the DataFrame, using the compiled validator if available.
+
+        The tables of pyswap.components.tables carry a validator generated
+        ahead of time (see pyswap.components._gen_validators). It is tried
+        first; if it rejects the DataFrame, the full pandera validation runs
+        to produce the usual SchemaError.
+        """
+        aliases = {k: v for k, v in cls._column_aliases.items() if k in check_obj}
+        if aliases:
+            check_obj = check_obj.rename(columns=aliases)
+
+        dates = cls._parse_dates(check_obj)
+        if dates:
+            check_obj = check_obj.assign(**dates)
+
+        fast_validate = cls.__dict__.get("_fast_validate")
+        if fast_validate is not None and not (head or tail or sample or lazy):
+            try:
+                validated_df = fast_validate(check_obj if inplace else check_obj.copy())
+            except Exception:
+                # Rejected; pandera below raises the descriptive SchemaError
+                validated_df = None
+            if validated_df is not None:
+                validated_df.pandera.add_schema(cls.to_schema())
+                return cls._to_storage_dtypes(validated_df)
+        validated_df = cls.to_schema().validate(
+            check_obj, head, tail, sample, random_state, lazy, inplace
+        )
+        return cls._to_storage_dtypes(validated_df)
+
+    @classmethod
+    def _parse_dates(cls, df: pd.DataFrame) -> dict[str, pd.Series]:
+        """Parse string date columns with an explicit format.
+
+        Without a format pandas has to infer one for every column. The date
+        columns of a table (e.g. CROPSTART and CROPEND) are parsed together in
+        a single call, so dates shared between them are parsed only once
+        (cache=True). Columns that match none of the formats are returned
+        unparsed and left to pandera's coercion.
+        """
+        names = [
+            name
+            for name in cls._date_columns
+            if name in df and df[name].dtype == object
+        ]
+        if len(names) > 1:
+            values = pd.concat([df[name] for name in names], ignore_index=True)
+            for date_format in cls._date_formats:
+                try:
+                    dates = pd.to_datetime(values, format=date_format, cache=True)
+                except (ValueError, TypeError):
+                    continue
+                n = len(df)
+                return {
+                    name: pd.Series(
+                        dates.iloc[k * n : (k + 1) * n].to_numpy(),
+                        index=df.index,
+                        name=name,
+                    )
+                    for k, name in enumerate(names)
+                }
+        parsed = {}
+        for name in names:
+            for date_format in cls._date_formats:
+                try:
+                    parsed[name] = pd.to_datetime(
+                        df[name], format=date_format, cache=True
+                    )
+                except (ValueError, TypeError):
+                    continue
+                break
+        return parsed
+
+    @classmethod
+    def _to_storage_dtypes(cls, df: DataFrame) -> DataFrame:
+        dtypes = {k: v for k, v in cls._storage_dtypes.items() if k in df.columns}
+        return df.astype(dtypes) if dtypes else df
+
     @classmethod
     def create(cls, data: dict, columns: list | None = None) -> DataFrame:
         df = pd.DataFrame(data=data)
         if columns:
             df.columns = columns
-        else:
+        elif not all(name.isupper() for name in df.columns):
+            # Relabelling drops the column index pandas has built; skip it for
+            # tables that already have upper-case names (e.g. from update())
             df.columns = df.columns.str.upper()
         validated_df = cls.validate(df)
         return validated_df
@@ -150,3 +278,51 @@ def update(cls, table, new: dict):
         table_upd = table.to_dict("list")
         table_upd.update(new)
         return cls.create(table_upd)
+
+    @classmethod
+    def to_lookup(
+        cls, table: pd.DataFrame, x: str, y: str, dx: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resample a relation between two columns to a uniform step.
+
+        Tables such as QDRNTB or QWEIRTB describe a relation at irregular
+        points. Resampled at a fixed step `dx`, the value at `xq` is found by
+        indexing, `yu[int((xq - xu[0]) / dx)]`, instead of searching the
+        table. Values between the points are linearly interpolated.
+
+        Parameters:
+            table (DataFrame): The table, validated by this model.
+            x (str): Column with the numeric argument of the relation.
+            y (str): Column with the values of the relation.
+            dx (float): Step of the resampled argument.
+
+        Returns:
+            tuple: The resampled arguments and values.
+        """
+        if dx <= 0:
+            msg = f"The step must be positive, got {dx}."
+            raise ValueError(msg)
+        ordered = table.sort_values(x)
+        xp = ordered[x].to_numpy(dtype=float)
+        yp = ordered[y].to_numpy(dtype=float)
+        steps = int(np.floor((xp[-1] - xp[0]) / dx))
+        xu = xp[0] + dx * np.arange(steps + 1)
+        return xu, np.interp(xu, xp, yp)
+
+
+def column_alias(alias: str, name: str):
+    """Accept `alias` as another spelling of the column `name` of a table.
+
+    The alias is resolved once, when the class is built; validate() then only
+    renames the columns present in the DataFrame.
+
+    Parameters:
+        alias (str): Alternative column name.
+        name (str): Column name in the schema.
+    """
+
+    def decorator(cls):
+        cls._column_aliases = {**cls._column_aliases, alias: name}
+        return cls
+
+    return decorator
@@ -15,16 +15,9 @@ def load_csv(file: Path, delimiter=",", skiprows=None, index_col=None) -> DataFr
     Arguments:
         file: Path to the .csv file.
     """
-    if skiprows:
-        return read_csv(
-            file,
-            delimiter=delimiter,
-            skiprows=skiprows,
-            index_col=index_col,
-        )
-    else:
-        return read_csv(
-            file,
-            delimiter=delimiter,
-            index_col=index_col,
-        )
+    return read_csv(
+        file,
+        delimiter=delimiter,
+        skiprows=skiprows,
+        index_col=index_col,
+    )
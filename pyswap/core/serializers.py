@@ -19,7 +19,97 @@
 
 from datetime import date
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, MultiIndex
+from pandas.api.types import infer_dtype
+
+# Significant decimals of floats in DataFrame.to_string (display.precision)
+_FLOAT_DIGITS = 6
+_NON_FINITE = {"nan": "NaN", "inf": "inf", "-inf": "-inf"}
+
+
+def _format_ints(values: np.ndarray) -> list[str]:
+    formatted: list[str] = values.astype(str).tolist()
+    return formatted
+
+
+def _format_dates(values: np.ndarray) -> list[str] | None:
+    """Format dates without a time of day as YYYY-MM-DD."""
+    days = values.astype("datetime64[D]")
+    if np.isnat(values).any() or (days != values).any():
+        return None
+    formatted: list[str] = np.datetime_as_string(days, unit="D").tolist()
+    return formatted
+
+
+def _format_strings(values: np.ndarray) -> list[str] | None:
+    if infer_dtype(values, skipna=False) != "string":
+        return None
+    formatted: list[str] = values.tolist()
+    joined = "".join(formatted)
+    # pandas escapes these characters
+    if "\t" in joined or "\r" in joined or "\n" in joined:
+        return None
+    return formatted
+
+
+def _format_floats(values: np.ndarray) -> list[str] | None:
+    """Format floats with the decimals the column needs, at most six."""
+    abs_values = np.abs(values[np.isfinite(values)])
+    if ((abs_values > 0) & (abs_values < 10**-_FLOAT_DIGITS)).any() or (
+        abs_values > 1e6
+    ).any():
+        return None
+
+    # Drop the trailing zeros all numbers share, keeping at least one decimal
+    formatted = [f"{v:.{_FLOAT_DIGITS}f}" for v in values.tolist()]
+    trim = min(
+        (len(x) - len(x.rstrip("0")) for x in formatted if "." in x),
+        default=0,
+    )
+    trim = min(trim, _FLOAT_DIGITS - 1)
+    return [
+        (x[:-trim] if trim else x) if "." in x else _NON_FINITE[x] for x in formatted
+    ]
+
+
+# Formatters of the columns by NumPy dtype kind. Each returns the formatted
+# values as DataFrame.to_string(index=False) writes them, or None for values it
+# does not cover, so that the caller can fall back to to_string().
+_FORMATTERS = {
+    "i": _format_ints,
+    "u": _format_ints,
+    "f": _format_floats,
+    "M": _format_dates,
+    "O": _format_strings,
+}
+
+
+def _to_string(table: DataFrame, header: bool = True) -> str:
+    """Write the table like DataFrame.to_string(index=False).
+
+    Each column is formatted to a list of strings in one pass and padded to
+    its width; the rows are then joined in a single call. Tables with columns
+    not covered by _FORMATTERS are written by to_string().
+    """
+    if table.empty or isinstance(table.columns, MultiIndex):
+        return table.to_string(index=False, header=header)
+
+    columns = []
+    for name, column in table.items():
+        values = column.to_numpy()
+        formatter = _FORMATTERS.get(values.dtype.kind)
+        formatted = formatter(values) if formatter else None
+        if formatted is None:
+            return table.to_string(index=False, header=header)
+        if header:
+            # pandas leaves room for a sign in the header of numeric columns
+            label = f" {name}" if column.dtype.kind in "iuf" else str(name)
+            formatted.insert(0, label)
+        width = max(map(len, formatted))
+        columns.append([x.rjust(width) for x in formatted])
+
+    return "\n".join(map(" ".join, zip(*columns, strict=True)))
 
 
 def serialize_table(table: DataFrame) -> str:
@@ -31,7 +121,7 @@ def serialize_table(table: DataFrame) -> str:
     Result:
         >>> ' A  B\n 1  4\n 2  5\n 3  6\n'
     """
-    return f"{table.to_string(index=False)}\n"
+    return f"{_to_string(table)}\n"
 
 
 def serialize_arrays(table: DataFrame) -> str:
@@ -43,7 +133,7 @@ def serialize_arrays(table: DataFrame) -> str:
     Result:
         >>> 'ARRAYS = \n1 4\n2 5\n3 6\n\n'
     """
-    return f"\n{table.to_string(index=False, header=False)}\n"
+    return f"\n{_to_string(table, header=False)}\n"
 
 
 def serialize_day_month(value: date) -> str:
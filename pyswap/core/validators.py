@@ -0,0 +1,270 @@
+"""Compiled validators for the most frequently validated tables.
+
+pandera interprets the schema of a table on every call to validate(). For the
+large tables that are created for each simulation (meteorological data,
+irrigation events) that overhead dominates. generate_validator_source writes a
+plain Python function for a pandera schema. pyswap.components._gen_validators
+generates these functions for the tables ahead of time, and each table stores
+its function on the class when it is defined. BaseTableModel.validate() runs
+that function first and falls back to the full pandera validation whenever it
+fails, so the error messages users see are still the ones raised by pandera.
+
+Functions:
+    generate_validator_source: Generate the source of the validator for a
+        pandera DataFrameSchema.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from pandera import DataFrameSchema
+
+# Element-wise checks that the generated code knows how to reproduce. Schemas
+# with any other column check are left to pandera. Dataframe-wide checks are
+# called as they are.
+_BOUND_CHECKS = {
+    "greater_than_or_equal_to": ("min_value", "<"),
+    "less_than_or_equal_to": ("max_value", ">"),
+    "greater_than": ("min_value", "<="),
+    "less_than": ("max_value", ">="),
+}
+
+
+def _is_compilable(schema: DataFrameSchema) -> bool:
+    """Check that the schema only uses features reproduced by the generator."""
+    if (
+        any(check.element_wise or check.groupby for check in schema.checks)
+        or schema.parsers
+        or schema.index is not None
+        or schema.unique
+        or schema.strict
+        or schema.ordered
+        or schema.add_missing_columns
+        or schema.drop_invalid_rows
+    ):
+        return False
+    for column in schema.columns.values():
+        if column.regex or column.unique or column.parsers:
+            return False
+        for check in column.checks:
+            if check.name not in _BOUND_CHECKS or not _is_numeric(column.dtype):
+                return False
+    return True
+
+
+def _is_numeric(dtype) -> bool:
+    return isinstance(getattr(dtype, "type", None), np.dtype) and (
+        dtype.type.kind in "iuf"
+    )
+
+
+def _bound(column, check_name: str):
+    """Return the bound of the named check, or the dtype's limit without one."""
+    for check in column.checks:
+        if check.name == check_name:
+            return check.statistics[
+                "min_value" if check_name == "greater_than_or_equal_to" else "max_value"
+            ]
+    info = np.finfo if column.dtype.type.kind == "f" else np.iinfo
+    limits = info(column.dtype.type)
+    return limits.min if check_name == "greater_than_or_equal_to" else limits.max
+
+
+def _small_int_range(column) -> np.ndarray | None:
+    """Return the allowed values of an integer column bounded to a small range.
+
+    Applies to integer columns with both a ge and a le bound spanning at most
+    64 values (e.g. a switch or a record number).
+    """
+    if not (_is_numeric(column.dtype) and column.dtype.type.kind in "iu"):
+        return None
+    names = {check.name for check in column.checks}
+    if names != {"greater_than_or_equal_to", "less_than_or_equal_to"}:
+        return None
+    lower = _bound(column, "greater_than_or_equal_to")
+    upper = _bound(column, "less_than_or_equal_to")
+    if upper - lower >= 64:
+        return None
+    return np.arange(lower, upper + 1, dtype=column.dtype.type)
+
+
+def _bound_blocks(schema: DataFrameSchema) -> dict[str, list[str]]:
+    """Group required, bounded numeric columns by dtype.
+
+    Only groups of at least two columns are returned; a single column is checked
+    on its own.
+    """
+    blocks: dict[str, list[str]] = {}
+    for name, column in schema.columns.items():
+        if (
+            column.required
+            and column.checks
+            and _is_numeric(column.dtype)
+            and all(
+                check.name in ("greater_than_or_equal_to", "less_than_or_equal_to")
+                for check in column.checks
+            )
+        ):
+            blocks.setdefault(str(column.dtype.type), []).append(name)
+    return {dtype: names for dtype, names in blocks.items() if len(names) > 1}
+
+
+def _bound_lines(
+    i: int, key: str, column, namespace: dict, prefix: str = ""
+) -> list[str]:
+    """Generate the bound checks of a single column."""
+    allowed = _small_int_range(column)
+    if allowed is not None:
+        # A handful of allowed integers: one table lookup per value
+        namespace[f"{prefix}_allowed_{i}"] = allowed
+        return [
+            f"if not np.isin(s.to_numpy(), {prefix}_allowed_{i}).all():",
+            f"    raise ValueError('column ' + {key} + ' out of bounds')",
+        ]
+    lines = ["a = s.to_numpy()"] if column.checks else []
+    for check in column.checks:
+        statistic, op = _BOUND_CHECKS[check.name]
+        bound = check.statistics[statistic]
+        if isinstance(bound, int | float) and np.isfinite(bound):
+            bound = repr(bound)
+        else:
+            bound_name = f"{prefix}_bound_{i}_{statistic}"
+            namespace[bound_name] = bound
+            bound = bound_name
+        lines += [
+            f"if (a {op} {bound}).any():",
+            f"    raise ValueError('column ' + {key} + ' out of bounds')",
+        ]
+    return lines
+
+
+def _cast_lines(schema: DataFrameSchema) -> tuple[list[str], dict, set[str]]:
+    """Generate the checks for missing columns, the casts and the null checks.
+
+    Returns:
+        The lines, the dtypes the columns are cast to, and the columns whose
+        null check is covered.
+    """
+    lines = []
+    for column_name, column in schema.columns.items():
+        if column.required:
+            key = repr(column_name)
+            lines += [
+                f"    if {key} not in columns:",
+                f"        raise ValueError('column ' + {key} + ' is missing')",
+            ]
+
+    # Numeric columns are cast in a single astype() call, leaving out those
+    # that already have their dtype
+    casts = {
+        column_name: str(column.dtype.type)
+        for column_name, column in schema.columns.items()
+        if (schema.coerce or column.coerce) and _is_numeric(column.dtype)
+    }
+    if casts:
+        present = (
+            ""
+            if all(schema.columns[column_name].required for column_name in casts)
+            else "k in columns and "
+        )
+        lines += [
+            "    dtypes = df.dtypes",
+            f"    casts = {casts!r}",
+            f"    casts = {{k: v for k, v in casts.items() if {present}dtypes[k] != v}}",
+            "    if casts:",
+            "        df = df.astype(casts)",
+        ]
+
+    # Integer columns cannot hold nulls once cast; the required float columns
+    # are checked together
+    not_null = [
+        column_name
+        for column_name, dtype in casts.items()
+        if dtype.startswith("float")
+        and schema.columns[column_name].required
+        and not schema.columns[column_name].nullable
+    ]
+    if not_null:
+        lines += [
+            f"    if df[{not_null!r}].isna().to_numpy().any():",
+            f"        raise ValueError({', '.join(not_null) + ' contain nulls'!r})",
+        ]
+    checked = set(not_null) | {k for k, v in casts.items() if not v.startswith("float")}
+    return lines, casts, checked
+
+
+def generate_validator_source(
+    schema: DataFrameSchema, name: str = "_validate", prefix: str = ""
+) -> tuple[str, dict]:
+    """Generate the source of a validator function for the schema.
+
+    The generated function takes a DataFrame, coerces its columns in place and
+    raises ValueError at the first violation of the schema. Coercion functions
+    and bounds that cannot be written as literals are returned in a namespace
+    dictionary, which has to be written out together with the source.
+
+    Arguments:
+        schema: The pandera schema to generate the validator for.
+        name: Name of the generated function.
+        prefix: Prefix of the names in the namespace, to keep them apart when
+            the sources of several validators share one module.
+
+    Returns:
+        The source of the function and its namespace.
+    """
+    namespace: dict = {"np": np}
+    lines = [f"def {name}(df):", "    columns = df.columns"]
+    cast_lines, casts, checked = _cast_lines(schema)
+    lines += cast_lines
+
+    blocks = _bound_blocks(schema)
+    in_block = {name for names in blocks.values() for name in names}
+    for i, (column_name, column) in enumerate(schema.columns.items()):
+        key = repr(column_name)
+        body = []
+        if (
+            (schema.coerce or column.coerce)
+            and column.dtype is not None
+            and column_name not in casts
+        ):
+            namespace[f"{prefix}_coerce_{i}"] = column.dtype.coerce
+            body += [f"s = {prefix}_coerce_{i}(s)", f"df[{key}] = s"]
+        if not column.nullable and column_name not in checked:
+            body += [
+                "if s.isna().any():",
+                f"    raise ValueError('column ' + {key} + ' contains nulls')",
+            ]
+        if column_name not in in_block:
+            body += _bound_lines(i, key, column, namespace, prefix)
+        if not body:
+            continue
+        body.insert(0, f"s = df[{key}]")
+        if column.required:
+            lines += ["    " + line for line in body]
+        else:
+            lines.append(f"    if {key} in columns:")
+            lines += ["        " + line for line in body]
+
+    # Columns of one dtype bounded by ge/le are checked in a single comparison
+    # of the 2-D array against the broadcast bounds of each column.
+    for j, (dtype, names) in enumerate(blocks.items()):
+        lower = [_bound(schema.columns[n], "greater_than_or_equal_to") for n in names]
+        upper = [_bound(schema.columns[n], "less_than_or_equal_to") for n in names]
+        namespace[f"{prefix}_lower_{j}"] = np.array(lower, dtype=dtype)
+        namespace[f"{prefix}_upper_{j}"] = np.array(upper, dtype=dtype)
+        lines += [
+            f"    a = df[{names!r}].to_numpy()",
+            f"    if ((a < {prefix}_lower_{j}) | (a > {prefix}_upper_{j})).any():",
+            f"        raise ValueError({', '.join(names) + ' out of bounds'!r})",
+        ]
+
+    # Dataframe-wide checks (e.g. relations between columns) run on the coerced
+    # frame, after all column checks, as they do in pandera.
+    for k, check in enumerate(schema.checks):
+        namespace[f"{prefix}_frame_check_{k}"] = check._check_fn
+        lines += [
+            f"    if not np.all({prefix}_frame_check_{k}(df)):",
+            f"        raise ValueError('check ' + {check.name!r} + ' failed')",
+        ]
+    lines.append("    return df")
+    return "\n".join(lines) + "\n", namespace
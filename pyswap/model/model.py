@@ -29,14 +29,19 @@
 
 import logging
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache
 from multiprocessing import Pool
+from multiprocessing.pool import Pool as ProcessPool
 from pathlib import Path
 from typing import Literal
 
-from pandas import DataFrame, read_csv, to_datetime
+from pandas import DataFrame, read_csv
 from pydantic import Field, PrivateAttr, model_validator
 
 from pyswap.components.boundary import BottomBoundary
@@ -55,7 +60,7 @@
 )
 from pyswap.components.transport import HeatFlow, SoluteTransport
 from pyswap.core.basemodel import PySWAPBaseModel
-from pyswap.core.defaults import IS_WINDOWS
+from pyswap.core.defaults import EXTENSIONS, IS_WINDOWS
 from pyswap.core.fields import Subsection
 from pyswap.core.io.io_ascii import open_ascii
 from pyswap.db.co2concentration import CO2concentration
@@ -67,6 +72,23 @@
 
 __all__ = ["Model", "run_parallel"]
 
+# Number of last lines of the SWAP output kept by ModelRunner.run_swap
+_STDOUT_TAIL = 50
+
+# Files SWAP writes in the run directory whatever the outfil: the log (named
+# after swap.swp), the log of the reruns and the completion flag
+_SWAP_LOG = "swap_swap.log"
+_RUN_FILES = (_SWAP_LOG, "reruns.log", "swap.ok")
+
+# Lines of the log starting with "warning", in any case, after any indentation
+_WARNING_LINE = re.compile(r"^[^\S\n]*warning.*$", flags=re.IGNORECASE | re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _swap_executable() -> Path:
+    """Return the path of the SWAP executable for this platform."""
+    return Path(str(swap_windows if IS_WINDOWS else swap_linux))
+
 
 class ModelBuilder:
     """Building model components.
@@ -86,15 +108,25 @@ def __init__(self, model: Model, tempdir: str):
         self.tempdir = tempdir
 
     def copy_executable(self) -> None:
-        """Copy the appropriate SWAP executable to the temporary directory."""
-        if IS_WINDOWS:
-            shutil.copy(swap_windows, self.tempdir)
-            logger.info(
-                "Copying the windows version of SWAP into temporary directory..."
-            )
-        else:
-            shutil.copy(swap_linux, self.tempdir)
-            logger.info("Copying linux executable into temporary directory...")
+        """Copy the appropriate SWAP executable to the temporary directory.
+
+        The executable is hard-linked into the directory when it is on the
+        same file system as the package, which avoids copying it for every
+        run. It is copied otherwise.
+        """
+        executable = _swap_executable()
+        target = Path(self.tempdir, executable.name)
+        if target.exists():
+            # A working directory reused between runs
+            if target.samefile(executable):
+                return self
+            target.unlink()
+        try:
+            os.link(executable, target)
+            logger.info("Linking SWAP executable into temporary directory...")
+        except OSError:
+            shutil.copy(executable, target)
+            logger.info("Copying SWAP executable into temporary directory...")
 
         return self
 
@@ -160,6 +192,7 @@ class ModelRunner:
 
     Methods:
         run_swap: Run the SWAP executable.
+        clear_outputs: Remove the output files of a previous run.
         raise_swap_warning: Raise a warning.
         run: Main function that runs the model
     """
@@ -174,21 +207,60 @@ def run_swap(tempdir: Path) -> str:
         Run the exacutable in the tempdirectory and pass the newline to the
         stdin when the executable asks for input (upon termination).
 
+        The output is read line by line as the model runs. Only the lines
+        mentioning an error or a warning and the last lines (which report
+        the completion of the run) are kept; the full log is written to the
+        log file anyway.
+
         Parameters:
             tempdir (Path): The temporary directory where the executable
                 is stored.
         """
         swap_path = Path(tempdir, "swap.exe") if IS_WINDOWS else "./swap420"
-        p = subprocess.Popen(
+        with subprocess.Popen(
             swap_path,
             stdout=subprocess.PIPE,
             stdin=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             cwd=tempdir,
-        )
-        stdout = p.communicate(input=b"\n")[0]
+        ) as p:
+            with suppress(BrokenPipeError):
+                p.stdin.write(b"\n")
+                p.stdin.close()
+
+            marked = []
+            tail: deque[tuple[int, str]] = deque(maxlen=_STDOUT_TAIL)
+            for i, line in enumerate(p.stdout):
+                text = line.decode()
+                if any(marker in text.lower() for marker in ("error", "warning")):
+                    marked.append((i, text))
+                tail.append((i, text))
+
+        first_in_tail = tail[0][0] if tail else 0
+        lines = [text for i, text in marked if i < first_in_tail]
+        return "".join(lines + [text for _, text in tail])
+
+    def clear_outputs(self, workdir: str | Path) -> None:
+        """Remove the output files of a previous run.
+
+        Used before running in a reused `workdir`: the input files are
+        overwritten by the next run, but the outputs of the previous one
+        would otherwise be read into the new Result. Only the files SWAP
+        writes for the `outfil` of the model are removed; any other file in
+        `workdir` is left alone.
 
-        return stdout.decode()
+        Parameters:
+            workdir (str | Path): The directory the model is run in.
+        """
+        outfil = self.model.generalsettings.outfil
+        outputs = [
+            *_RUN_FILES,
+            f"{outfil}_output.csv",
+            f"{outfil}_output_tz.csv",
+            *(f"{outfil}.{ext}" for ext in EXTENSIONS if not ext.startswith("csv")),
+        ]
+        for name in outputs:
+            Path(workdir, name).unlink(missing_ok=True)
 
     def raise_swap_warning(self, warnings: list):
         """Log the warnings form the model run.
@@ -200,7 +272,13 @@ def raise_swap_warning(self, warnings: list):
         for message in warnings:
             logger.warning(message)
 
-    def run(self, path: str | Path, silence_warnings: bool = False) -> Result:
+    def run(
+        self,
+        path: str | Path,
+        silence_warnings: bool = False,
+        workdir: str | Path | None = None,
+        keep: bool = False,
+    ) -> Result:
         """Main function that runs the model.
 
         First ModelBuilder is used to prepare the environment for the model run.
@@ -208,52 +286,76 @@ def run(self, path: str | Path, silence_warnings: bool = False) -> Result:
         the executable is parsed using the ResultReader and used to update the
         Result object.
 
+        By default the model runs in a new temporary directory in `path`,
+        removed afterwards. For many short runs (e.g. a parameter sweep) a
+        `workdir` can be given instead: it is created if needed and reused by
+        every run, and never removed. The output files of the previous run
+        (those named after `outfil`, the SWAP log and swap.ok) are removed
+        before each run and the input files overwritten; other files in
+        `workdir` are kept.
+
         Parameters:
             path (str | Path): The path to the temporary directory.
             silence_warnings (bool): If True, warnings are not raised.
+            workdir (str | Path): Directory to run the model in instead of a
+                temporary directory.
+            keep (bool): If True, the temporary directory is not removed.
 
         Returns:
             Result: The parsed model results.
         """
+        if workdir is not None:
+            Path(workdir).mkdir(parents=True, exist_ok=True)
+            self.clear_outputs(workdir)
+            return self._run_in(workdir, silence_warnings)
+        if keep:
+            tempdir = tempfile.mkdtemp(dir=path)
+            logger.info(f"Model files kept in {tempdir}")
+            return self._run_in(tempdir, silence_warnings)
+        with tempfile.TemporaryDirectory(
+            dir=path, ignore_cleanup_errors=True
+        ) as tempdir:
+            return self._run_in(tempdir, silence_warnings)
 
-        with tempfile.TemporaryDirectory(dir=path) as tempdir:
-            builder = ModelBuilder(self.model, tempdir)
-            builder.copy_executable().write_inputs()
+    def _run_in(self, tempdir: str | Path, silence_warnings: bool) -> Result:
+        """Run the model in the given directory and read its results."""
+        builder = ModelBuilder(self.model, tempdir)
+        builder.copy_executable().write_inputs()
 
-            stdout = self.run_swap(tempdir)
+        stdout = self.run_swap(tempdir)
 
-            if "normal completion" not in stdout:
-                msg = f"Model run failed. \n {stdout}"
-                raise RuntimeError(msg)
+        if "normal completion" not in stdout:
+            msg = f"Model run failed. \n {stdout}"
+            raise RuntimeError(msg)
 
-            logger.info(stdout)
+        logger.info(stdout)
 
-            # --- Handle the results ---
-            result: Result = Result()
+        # --- Handle the results ---
+        result: Result = Result()
 
-            reader = ResultReader(self.model, tempdir)
+        reader = ResultReader(self.model, tempdir)
 
-            log = reader.read_swap_log()
-            result.log = log
+        log = reader.read_swap_log()
+        result.log = log
 
-            warnings = reader.identify_warnings(log)
-            result.warning = warnings
+        warnings = reader.identify_warnings(log)
+        result.warning = warnings
 
-            if warnings and not silence_warnings:
-                self.raise_swap_warning(warnings=warnings)
+        if warnings and not silence_warnings:
+            self.raise_swap_warning(warnings=warnings)
 
-            if "csv" in self.model.generalsettings.extensions:
-                output = reader.read_csv_output(which="csv")
-                result.output.update({"csv": output})
+        if "csv" in self.model.generalsettings.extensions:
+            output = reader.read_csv_output(which="csv")
+            result.output.update({"csv": output})
 
-            if "csv_tz" in self.model.generalsettings.extensions:
-                output_tz = reader.read_csv_output(which="csv_tz")
-                result.output.update({"csv_tz": output_tz})
+        if "csv_tz" in self.model.generalsettings.extensions:
+            output_tz = reader.read_csv_output(which="csv_tz")
+            result.output.update({"csv_tz": output_tz})
 
-            ascii_files = reader.read_ascii_output()
+        ascii_files = reader.read_ascii_output()
 
-            result.output.update(ascii_files)
-            return result
+        result.output.update(ascii_files)
+        return result
 
 
 class ResultReader:
@@ -298,13 +400,17 @@ def read_csv_output(self, which: Literal["csv", "csv_tz"]) -> DataFrame:
             logger.warning(f"Expected output file {path} not found.")
             return DataFrame()
 
-        df = read_csv(path, comment="*", index_col=index_col)
-        df.index = to_datetime(df.index)
-
-        return df
+        # Dates are parsed while reading; repeated dates only once
+        return read_csv(
+            path,
+            comment="*",
+            index_col=index_col,
+            parse_dates=[index_col],
+            cache_dates=True,
+        )
 
     def read_swap_log(self) -> str:
-        """Read the log files.
+        """Read the log file.
 
         Returns:
             str: The content of the log file.
@@ -312,24 +418,14 @@ def read_swap_log(self) -> str:
         Raises:
             FileNotFoundError: If no log file is found. There should always be
                 a log file. If not, something went wrong.
-            FileExistsError: If multiple log files are found. Not sure if this
-                is possible or not. If so, it should be handled.
         """
 
-        log_files = [
-            f for f in Path(self.tempdir).glob("*.log") if f.name != "reruns.log"
-        ]
+        log_file = Path(self.tempdir, _SWAP_LOG)
 
-        if len(log_files) == 0:
-            msg = "No .log file found in the directory."
+        if not log_file.is_file():
+            msg = f"No {_SWAP_LOG} file found in the directory."
             raise FileNotFoundError(msg)
 
-        elif len(log_files) > 1:
-            msg = "Multiple .log files found in the directory."
-            raise FileExistsError(msg)
-
-        log_file = log_files[0]
-
         with open(log_file) as file:
             log_content = file.read()
 
@@ -347,11 +443,7 @@ def identify_warnings(log: str) -> list:
         Returns:
             list: A list of warnings.
         """
-        lines = log.split("\n")
-        warnings = [
-            line for line in lines if line.strip().lower().startswith("warning")
-        ]
-        return warnings
+        return _WARNING_LINE.findall(log)
 
     def read_ascii_output(self):
         """Read all output files that are not csv format as strings.
@@ -370,15 +462,13 @@ def read_ascii_output(self):
             if ext not in ["csv", "csv_tz"]
         ]
 
-        list_dir = os.listdir(self.tempdir)
-        list_dir = [f for f in list_dir if f.endswith(tuple(ascii_extensions))]
-
-        if list_dir:
-            dict_files = {
-                f.split(".")[1]: open_ascii(Path(self.tempdir, f)) for f in list_dir
-            }
-            return dict_files
-        return {}
+        outfil = self.model.generalsettings.outfil
+        dict_files = {
+            ext: open_ascii(Path(self.tempdir, f"{outfil}.{ext}"))
+            for ext in ascii_extensions
+            if Path(self.tempdir, f"{outfil}.{ext}").is_file()
+        }
+        return dict_files
 
 
 class Model(PySWAPBaseModel, FileMixin, SerializableMixin):
@@ -499,7 +589,7 @@ def validate_each_component(self):
         if not self._validate_on_run:
             return self
 
-        for comp in self.model_fields:
+        for comp in type(self).model_fields:
             item = getattr(self, comp)
             if hasattr(item, "validate_with_yaml"):
                 item._validation = True
@@ -545,12 +635,20 @@ def to_classic_swap(self, path: Path) -> None:
         logger.info(f"Model files written to {path}")
 
     def run(
-        self, path: str | Path | None = None, silence_warnings: bool = False
+        self,
+        path: str | Path | None = None,
+        silence_warnings: bool = False,
+        *,
+        workdir: str | Path | None = None,
+        keep: bool = False,
     ) -> Result:
-        """Run the model using ModelRunner."""
+        """Run the model using ModelRunner.
+
+        See ModelRunner.run for the use of `workdir` and `keep`.
+        """
         self.validate()
         path = Path.cwd() if path is None else path
-        return ModelRunner(self).run(path, silence_warnings)
+        return ModelRunner(self).run(path, silence_warnings, workdir=workdir, keep=keep)
 
 
 def _run_model_with_params(args) -> Result:
@@ -563,22 +661,31 @@ def run_parallel(
     mls: list[Model],
     path: Path | str | None = None,
     silence_warnings: bool = False,
+    pool: ProcessPool | None = None,
     **kwargs,
 ) -> list[Result]:
     """Run multiple models in parallel.
 
+    Starting the worker processes takes a noticeable part of a batch of short
+    runs. When running several batches (e.g. in a calibration loop), create
+    the pool once and pass it to each call; it is left open.
+
     Parameters:
         mls (list[Model]): List of models to run.
         path (Path | str): The path to the temporary directory.
         silence_warnings (bool): If True, warnings are not raised.
+        pool (Pool): Pool of worker processes to run the models in. A new pool
+            is created and closed afterwards if not given.
         **kwargs (dict): Keyword arguments for Pool().
 
     Returns:
         list[Result]: List of results from the model runs.
     """
+    args = [(model, path, silence_warnings) for model in mls]
+    if pool is not None:
+        return pool.map(_run_model_with_params, args)
+
     with Pool(**kwargs) as pool:
-        results = pool.map(
-            _run_model_with_params, [(model, path, silence_warnings) for model in mls]
-        )
+        results = pool.map(_run_model_with_params, args)
 
     return results
@@ -7,19 +7,29 @@
 stores the log file, output file, and warnings. Output is a dictionary with
 the keys being the file extensions and the values being the file contents. There
 are also computed properties making the most common output formats easily
-accessible.
+accessible. They are computed on first access and cached; assigning `log`
+or `output` clears the cached values derived from it.
 
 Classes:
     Result: Result of a model run.
 """
 
-import re
+from functools import cached_property
 
 from pandas import DataFrame
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field
 
 __all__ = ["Result"]
 
+# Heading of the last section of the log
+_ITERATION_STATISTICS = "Iteration statistics"
+
+# Cached properties derived from each field
+_DERIVED = {
+    "log": ("iteration_stats",),
+    "output": ("ascii", "csv", "csv_tz", "yearly_summary"),
+}
+
 
 class Result(BaseModel):
     """Result of a model run.
@@ -48,36 +58,44 @@ class Result(BaseModel):
         arbitrary_types_allowed=True, validate_assignment=True, extra="forbid"
     )
 
-    @computed_field(return_type=dict, repr=False)
+    def __setattr__(self, name, value):
+        """Clear the cached properties derived from the assigned field."""
+        super().__setattr__(name, value)
+        for derived in _DERIVED.get(name, ()):
+            self.__dict__.pop(derived, None)
+
+    @cached_property
     def ascii(self) -> dict:
         """Return all outputs in ASCII format."""
         return {k: v for k, v in self.output.items() if not k.endswith("csv")}
 
-    @computed_field(return_type=DataFrame, repr=False)
+    @cached_property
     def csv(self) -> DataFrame:
         """Return the output in CSV format."""
         return self.output.get("csv", None)
 
-    @computed_field(return_type=DataFrame, repr=False)
+    @cached_property
     def csv_tz(self) -> DataFrame:
         """Return the output in CSV format with depth."""
         return self.output.get("csv_tz", None)
 
-    @computed_field(return_type=str, repr=False)
+    @cached_property
     def iteration_stats(self) -> str:
         """Print the part the iteration statistics from the log."""
-        match = re.search(r".*(Iteration statistics\s*.*)$", self.log, re.DOTALL)
-        if match:
-            return match.group(1)
+        if not self.log:
+            return ""
+        start = self.log.rfind(_ITERATION_STATISTICS)
+        if start != -1:
+            return self.log[start:]
         return ""
 
-    @computed_field(return_type=str, repr=False)
+    @property
     def blc_summary(self) -> str:
         """Print the .blc file if it exists."""
         print(self.output.get("blc", None))
         return
 
-    @computed_field(return_type=DataFrame, repr=False)
+    @cached_property
     def yearly_summary(self) -> DataFrame:
         """Return yearly sums of all output variables."""
         if not isinstance(self.csv, DataFrame):
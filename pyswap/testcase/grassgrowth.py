@@ -1,10 +1,22 @@
 # mypy: disable-error-code="attr-defined"
 
+from functools import lru_cache
+
 import pyswap as psp
 from pyswap import testcase
 
 
 def _make_grassgrowth():
+    """Return a copy of the grassgrowth model.
+
+    The model is loaded from the ascii files once; every call returns a deep
+    copy, so changes made by the caller do not carry over to the next call.
+    """
+    return _load_grassgrowth().model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _load_grassgrowth():
     """Loading the grassgrowth model from ascii files."""
     meta = psp.components.Metadata(
         author="John Doe",
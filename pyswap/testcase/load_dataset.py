@@ -1,12 +1,9 @@
 """Loading datasets for testcases."""
 
-import platform
 from pathlib import Path
 
 import pandas as pd
 
-IS_WINDOWS = platform.system() == "Windows"
-
 BASE_PATH: Path = Path(__file__).parent.joinpath("./data")
 
 RESOURCES: dict[str, dict[str, Path]] = {
@@ -48,6 +48,9 @@
 
 __all__ = ["load_swp"]
 
+# Parameters of the drainage levels (e.g. drares1, l2) that belong to Flux
+_FLUX_KEY = re.compile(r"(drares|infres|swallo|l|zbotdr|swdtyp|datowltb)[1-5]$")
+
 
 def _parse_ascii_file(path: Path, grass_crp: bool = False):
     """Parse the .swp file and return the parameters."""
@@ -114,21 +117,7 @@ def load_swp(path: Path, metadata: PySWAPBaseModel) -> Model:
 def load_dra(path: Path):
     params = _parse_ascii_file(path)
 
-    flux_objects_startwith = [
-        "drares",
-        "infres",
-        "swallo",
-        "l",
-        "zbotdr",
-        "swdtyp",
-        "datowltb",
-    ]
-
-    flux_objects = {
-        k: v
-        for k, v in params.items()
-        if any(re.match(f"{prefix}[1-5]$", k) for prefix in flux_objects_startwith)
-    }
+    flux_objects = {k: v for k, v in params.items() if _FLUX_KEY.match(k)}
     other_params = {k: v for k, v in params.items() if k not in flux_objects}
 
     flux = Flux(**flux_objects)
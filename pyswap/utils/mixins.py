@@ -76,8 +76,7 @@ def save_file(
         ext = self._extension
         fname = f"{fname}.{ext}" if ext else fname
 
-        with open(f"{path}/{fname}", "w", encoding="ascii") as f:
-            f.write(string)
+        Path(path, fname).write_text(string, encoding="ascii")
 
         logger.info(f"{fname} saved successfully.")
 
@@ -143,7 +142,7 @@ def is_annotated_exception_type(self, field_name: str) -> bool:
         json_schema_extra is None, return False.
         """
         # Every special field will have a FieldInfo object
-        field_info = self.model_fields.get(field_name, None)
+        field_info = type(self).model_fields.get(field_name, None)
 
         if field_info is None:
             return False
@@ -7,11 +7,19 @@
 import inspect
 import re
 
+import numpy as np
 import pandas as pd
 import pandera as pa
 
 import pyswap.components.tables as tables
 from pyswap.core.basemodel import BaseTableModel
+from pyswap.log import logging
+
+logger = logging.getLogger(__name__)
+
+# Full line comments start with *, partial comments with !
+_LINE_COMMENT = re.compile(r"^\*.*$", flags=re.MULTILINE)
+_PARTIAL_COMMENT = re.compile(r"!.*")
 
 
 def remove_comments(text: str) -> str:
@@ -32,9 +40,9 @@ def remove_comments(text: str) -> str:
         str: Stripped text with comments removed.
     """
     # Remove lines starting with *
-    text = re.sub(r"^\*.*$", "", text, flags=re.MULTILINE)
+    text = _LINE_COMMENT.sub("", text)
     # Remove everything after ! on each line
-    text = re.sub(r"!.*", "", text)
+    text = _PARTIAL_COMMENT.sub("", text)
 
     return text.strip()
 
@@ -179,17 +187,44 @@ def create_schema_object(
         columns (list): A list of column names.
         data (list): A list of data to validate.
     """
-    df = pd.DataFrame(data, columns=columns)
+    df = pd.DataFrame(_typed_columns(schema, columns, data) or data, columns=columns)
     try:
         schema_object = schema.validate(df)
     except pa.errors.SchemaError as e:
         msg = f"Validation error for {schema.__name__}: {e!s}"
-        print(msg)
+        logger.warning(msg)
         return None
     else:
         return schema_object
 
 
+def _typed_columns(
+    schema: BaseTableModel, columns: list, data: list
+) -> dict[str, np.ndarray] | None:
+    """Convert the numeric columns of the data to arrays of the schema dtype.
+
+    Each column is parsed by numpy in one call, so pandas neither infers the
+    dtypes nor casts the strings again during validation. Values that do not
+    parse (e.g. 1.5 in an integer column) leave the column as strings, to be
+    reported by the validation. Returns None for ragged or empty data.
+    """
+    if not data or any(len(row) != len(columns) for row in data):
+        return None
+    schema_columns = schema.to_schema().columns
+    typed = {}
+    for name, values in zip(columns, zip(*data, strict=True), strict=True):
+        dtype = getattr(schema_columns.get(name), "dtype", None)
+        dtype = getattr(dtype, "type", None)
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+            try:
+                typed[name] = np.asarray(values, dtype=dtype)
+            except (ValueError, OverflowError):
+                typed[name] = values
+        else:
+            typed[name] = values
+    return typed
+
+
 def create_table_objects(data_dict: dict) -> dict:
     """Create table objects.
 
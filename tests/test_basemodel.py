@@ -1,6 +1,11 @@
 import pandas as pd
+import pytest
+from pandera.errors import SchemaError
 
 import pyswap.components.crop as crp
+from pyswap.components._gen_validators import _TARGET, generate_module
+from pyswap.components.tables import IRRIGEVENTS, LSDBTB, QDRNTB
+from pyswap.core.serializers import serialize_table
 
 
 def test_model_serialization(simple_serializable_model):
@@ -39,5 +44,61 @@ def test_table_update():
     crp.CROPROTATION.update(table, {"CROPTYPE": [2]})
 
 
+def test_compiled_validator():
+    table = pd.DataFrame({
+        "IRDATE": ["2002-01-05", "2002-06-10"],
+        "IRDEPTH": [1, 20.5],
+        "IRCONC": [0, 0],
+        "IRTYPE": [1, 0],
+    })
+
+    pd.testing.assert_frame_equal(
+        IRRIGEVENTS.validate(table), IRRIGEVENTS.to_schema().validate(table)
+    )
+
+    # Invalid tables still raise pandera's error
+    table["IRTYPE"] = [1, 5]
+    with pytest.raises(SchemaError) as exc_info:
+        IRRIGEVENTS.validate(table)
+    assert "less_than_or_equal_to(1)" in str(exc_info.value)
+
+
+def test_generated_validators_up_to_date():
+    # Regenerate with `python -m pyswap.components._gen_validators`
+    assert _TARGET.read_text() == generate_module()
+
+
+def test_table_column_alias():
+    # create() upper-cases column names; LSDb must still be found
+    table = LSDBTB.create({
+        "LSDb": [0.0, 3.0],
+        "DAYSGRAZING": [0.0, 21.0],
+        "UPTGRAZING": [0.0, 20.0],
+        "LOSSGRAZING": [0.0, 400.0],
+    })
+    assert "LSDb" in table.columns
+
+
+def test_serialize_table_matches_to_string():
+    table = pd.DataFrame({
+        "DATE": pd.to_datetime(["2002-01-05", "2002-06-10", "2002-07-01"]),
+        "STATION": ["'Hupsel'", "'De Bilt'", "'Hupsel'"],
+        "LEVEL": [-1, 20, 300],
+        "VALUE": [0.5, float("nan"), 12.125],
+        "TINY": [1e-8, 0.0, 1.0],
+    })
+    for columns in (["DATE", "STATION", "LEVEL", "VALUE"], list(table)):
+        expected = table[columns].to_string(index=False)
+        assert serialize_table(table[columns]) == f"{expected}\n"
+
+
+def test_table_to_lookup():
+    table = QDRNTB.create({"QDRAIN": [0.0, 1.0, 4.0], "GWL": [-200.0, -100.0, 0.0]})
+    gwl, qdrain = QDRNTB.to_lookup(table, x="GWL", y="QDRAIN", dx=50.0)
+
+    assert gwl.tolist() == [-200.0, -150.0, -100.0, -50.0, 0.0]
+    assert qdrain.tolist() == [0.0, 0.5, 1.0, 2.5, 4.0]
+
+
 if __name__ == "__main__":
     test_table_update()
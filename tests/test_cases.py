@@ -105,6 +105,26 @@ def test_grassgrowth():
     )
 
 
+def test_grassgrowth_reused_workdir(tmp_path):
+    # Outputs of a previous run, named after the outfil of the model
+    for name in ("swap_swap.log", "result.blc", "result_output.csv"):
+        (tmp_path / name).write_text("stale")
+    # Files of the user that pyswap did not write
+    unrelated = ("notes.log", "mycrop.crp", "field.irg", "soil.ini", "keep.txt")
+    for name in unrelated:
+        (tmp_path / name).write_text("mine")
+
+    model = testcase.get("grassgrowth")
+    model.run(tmp_path, silence_warnings=True, workdir=tmp_path)
+    result = model.run(tmp_path, silence_warnings=True, workdir=tmp_path)
+
+    assert not (tmp_path / "result.blc").exists()
+    assert "stale" not in result.log
+    assert not result.csv.empty
+    for name in unrelated:
+        assert (tmp_path / name).read_text() == "mine"
+
+
 def test_simple_model():
     model = testcase.get("simple_test_model")
     model.run("./", silence_warnings=True)
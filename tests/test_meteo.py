@@ -17,6 +17,8 @@ def test_metfile_from_csv():
     table_exp = table_exp.rename(
         {col: col.upper() for col in table_exp.columns}, axis=1
     )
+    for col in ["DD", "MM", "YYYY"]:
+        table_exp[col] = table_exp[col].str.strip("'").astype(int)
     # Compare
     pd.testing.assert_frame_equal(
         table_test.content,
@@ -67,9 +69,6 @@ def test_metfile_from_knmi():
     table_exp.loc[:, "STATION"] = table_exp.STATION.apply(
         lambda x: f"'{x}'" if not str(x).startswith("'") else x
     )
-    table_exp["DD"] = table_exp["DD"].astype(str)
-    table_exp["MM"] = table_exp["MM"].astype(str)
-    table_exp["YYYY"] = table_exp["YYYY"].astype(str)
     # Compare
     pd.testing.assert_frame_equal(
         table_test,